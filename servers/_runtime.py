@@ -14,52 +14,82 @@ Variable naming pattern (provider slug uppercased, non-alphanumerics replaced wi
 - MCP_SERVER_<PROVIDER>_READ_TIMEOUT: Read timeout seconds (defaults to 300).
 
 Omit the provider segment to define global defaults (e.g., MCP_SERVER_URL).
+Resolved settings are cached per process; call ``_invalidate_config()`` after changing them.
 """
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import json
 import os
 import re
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from pydantic_ai.mcp import MCPServer, MCPServerStdio, MCPServerStreamableHTTP
 
 _CONFIG_PREFIX = "MCP_SERVER"
 _DEFAULT_TIMEOUT = 30.0
 _DEFAULT_READ_TIMEOUT = 300.0
+_NON_UPPER_ALNUM = re.compile(r"[^0-9A-Z]+")
 
-_SERVER_CACHE: dict[str, tuple[str, MCPServer]] = {}
-_STATIC_CONFIG_CACHE: dict[str, dict[str, Any]] = {}
+_SERVER_CACHE: dict[str, tuple[bytes, MCPServer]] = {}
+_CONFIG_CACHE: dict[str, tuple[dict[str, Any], bytes]] = {}
+# Read-only views: cache hits hand out the stored mapping instead of a copy
+_STATIC_CONFIG_CACHE: dict[str, Mapping[str, Any]] = {}
+
+
+class _Unset:
+    """Default for optional wrapper parameters; tells "not passed" apart from None."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+
+UNSET: Any = _Unset()
 
 
 async def call_tool(provider: str, tool: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
     """Call the MCP tool described by ``tool`` for ``provider``."""
-    payload = _coerce_arguments(args, kwargs)
+    return await invoke_tool(provider, tool, _coerce_arguments(args, kwargs))
+
+
+async def invoke_tool(provider: str, tool: dict[str, Any], arguments: dict[str, Any]) -> Any:
+    """Call the tool with an already-built arguments dict (used by specialized wrappers)."""
     tool_name = tool.get("name")
     if not tool_name:
         raise ValueError("tool definition must include a 'name' field")
     server = _get_server(provider)
-    return await server.direct_call_tool(tool_name, payload)
+    return await server.direct_call_tool(tool_name, arguments)
 
 
 def _coerce_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the arguments dict without copying it.
+
+    ``kwargs`` is already a fresh dict from the call, and a positional payload is handed
+    to the server as-is (it is only serialized); do not mutate it while the call is pending.
+    """
     if args and kwargs:
         raise ValueError("Pass arguments either positionally (single dict) or via kwargs, not both.")
     if not args:
-        return dict(kwargs)
+        return kwargs
     if len(args) != 1:
         raise TypeError("Pass a single dictionary positional argument or use keyword arguments.")
     payload = args[0]
     if not isinstance(payload, dict):
         raise TypeError("Positional tool arguments must be provided as a dict")
-    return dict(payload)
+    return payload
 
 
 def _get_server(provider: str) -> MCPServer:
-    config = _load_provider_config(provider)
-    fingerprint = json.dumps(config, sort_keys=True)
+    resolved = _CONFIG_CACHE.get(provider)
+    if resolved is None:
+        resolved = _CONFIG_CACHE[provider] = _load_provider_config(provider)
+    config, fingerprint = resolved
     cached = _SERVER_CACHE.get(provider)
     if cached and cached[0] == fingerprint:
         return cached[1]
@@ -68,52 +98,78 @@ def _get_server(provider: str) -> MCPServer:
     return server
 
 
+def _invalidate_config(provider: str | None = None) -> None:
+    """Forget resolved configs so the next call re-reads the environment."""
+    if provider is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(provider, None)
+
+
 def _build_server(config: dict[str, Any]) -> MCPServer:
-    transport = config["transport"]
-    if transport == "http":
-        return MCPServerStreamableHTTP(
-            config["url"],
-            headers=config.get("headers"),
-            timeout=config["timeout"],
-            read_timeout=config["read_timeout"],
-        )
-    if transport == "stdio":
-        return MCPServerStdio(
-            config["command"],
-            args=config.get("args"),
-            env=config.get("env"),
-            cwd=config.get("cwd"),
-            timeout=config["timeout"],
-            read_timeout=config["read_timeout"],
-        )
-    raise RuntimeError(f"Unsupported MCP transport: {transport}")
-
-
-def _load_provider_config(provider: str) -> dict[str, Any]:
+    try:
+        builder = _BUILDERS[config["transport"]]
+    except KeyError:
+        raise RuntimeError(f"Unsupported MCP transport: {config.get('transport')}") from None
+    return builder(config)
+
+
+def _build_http(config: dict[str, Any]) -> MCPServer:
+    return MCPServerStreamableHTTP(
+        config["url"],
+        headers=config.get("headers"),
+        timeout=config["timeout"],
+        read_timeout=config["read_timeout"],
+    )
+
+
+def _build_stdio(config: dict[str, Any]) -> MCPServer:
+    return MCPServerStdio(
+        config["command"],
+        args=config.get("args"),
+        env=config.get("env"),
+        cwd=config.get("cwd"),
+        timeout=config["timeout"],
+        read_timeout=config["read_timeout"],
+    )
+
+
+_BUILDERS: dict[str, Callable[[dict[str, Any]], MCPServer]] = {
+    "http": _build_http,
+    "stdio": _build_stdio,
+}
+
+
+def _load_provider_config(provider: str) -> tuple[dict[str, Any], bytes]:
+    """Resolve the provider config plus a 16-byte digest used to detect changes."""
+    config = _resolve_provider_config(provider)
+    canonical = repr(sorted(config.items())).encode()
+    return config, hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _resolve_provider_config(provider: str) -> dict[str, Any]:
     static_config = _load_static_config(provider)
     provider_key = _normalize_provider(provider)
-    timeout = _as_float(
-        _get_env(provider_key, "TIMEOUT"),
-        _as_float(_get_env("", "TIMEOUT"), static_config.get("timeout", _DEFAULT_TIMEOUT)),
-    )
+    # One snapshot; plain dict lookups instead of repeated os.environ accesses
+    env_snapshot = os.environ.copy()
+
+    def get_env(suffix: str) -> str | None:
+        scoped = env_snapshot.get(f"{_CONFIG_PREFIX}_{provider_key}_{suffix}")
+        return scoped or env_snapshot.get(f"{_CONFIG_PREFIX}_{suffix}")
+
+    timeout = _as_float(get_env("TIMEOUT"), static_config.get("timeout", _DEFAULT_TIMEOUT))
     read_timeout = _as_float(
-        _get_env(provider_key, "READ_TIMEOUT"),
-        _as_float(_get_env("", "READ_TIMEOUT"), static_config.get("read_timeout", _DEFAULT_READ_TIMEOUT)),
+        get_env("READ_TIMEOUT"), static_config.get("read_timeout", _DEFAULT_READ_TIMEOUT)
     )
-    transport = (
-        _get_env(provider_key, "TRANSPORT")
-        or _get_env("", "TRANSPORT")
-        or static_config.get("transport")
-        or "http"
-    ).lower()
+    transport = (get_env("TRANSPORT") or static_config.get("transport") or "http").lower()
 
     if transport == "http":
-        url = _get_env(provider_key, "URL") or _get_env("", "URL") or static_config.get("url")
+        url = get_env("URL") or static_config.get("url")
         if not url:
             raise RuntimeError(
                 f"Missing MCP server URL for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_URL or MCP_SERVER_URL."
             )
-        headers = _parse_mapping(_get_env(provider_key, "HEADERS") or _get_env("", "HEADERS"))
+        headers = _parse_mapping(get_env("HEADERS"))
         if headers is None:
             headers = static_config.get("headers")
         return {
@@ -125,18 +181,18 @@ def _load_provider_config(provider: str) -> dict[str, Any]:
         }
 
     if transport == "stdio":
-        command = _get_env(provider_key, "COMMAND") or _get_env("", "COMMAND") or static_config.get("command")
+        command = get_env("COMMAND") or static_config.get("command")
         if not command:
             raise RuntimeError(
                 f"Missing MCP server command for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_COMMAND."
             )
-        args = _parse_sequence(_get_env(provider_key, "ARGS") or _get_env("", "ARGS"))
+        args = _parse_sequence(get_env("ARGS"))
         if not args:
             args = list(static_config.get("args") or [])
-        env = _parse_mapping(_get_env(provider_key, "ENV") or _get_env("", "ENV"))
+        env = _parse_mapping(get_env("ENV"))
         if env is None:
             env = static_config.get("env")
-        cwd = _get_env(provider_key, "CWD") or _get_env("", "CWD") or static_config.get("cwd")
+        cwd = get_env("CWD") or static_config.get("cwd")
         return {
             "transport": "stdio",
             "command": command,
@@ -152,10 +208,10 @@ def _load_provider_config(provider: str) -> dict[str, Any]:
     )
 
 
-def _load_static_config(provider: str) -> dict[str, Any]:
+def _load_static_config(provider: str) -> Mapping[str, Any]:
     cached = _STATIC_CONFIG_CACHE.get(provider)
     if cached is not None:
-        return dict(cached)
+        return cached
     module_name = f"{__package__}.{provider}" if __package__ else provider
     try:
         module = importlib.import_module(module_name)
@@ -163,21 +219,16 @@ def _load_static_config(provider: str) -> dict[str, Any]:
         config: dict[str, Any] = {}
     else:
         config = getattr(module, "SERVER_CONFIG", {}) or {}
-    _STATIC_CONFIG_CACHE[provider] = dict(config)
-    return dict(config)
+    frozen = _STATIC_CONFIG_CACHE[provider] = MappingProxyType(dict(config))
+    return frozen
 
 
+@lru_cache(maxsize=64)
 def _normalize_provider(provider: str) -> str:
-    normalized = re.sub(r"[^0-9A-Z]+", "_", provider.upper()).strip("_")
-    return normalized
-
-
-def _get_env(provider_key: str, suffix: str) -> str | None:
-    if provider_key:
-        scoped = os.getenv(f"{_CONFIG_PREFIX}_{provider_key}_{suffix}")
-        if scoped:
-            return scoped
-    return os.getenv(f"{_CONFIG_PREFIX}_{suffix}")
+    upper = provider.upper()
+    if upper.isascii() and upper.isalnum():  # common case: nothing to replace
+        return upper
+    return _NON_UPPER_ALNUM.sub("_", upper).strip("_")
 
 
 def _as_float(value: str | None, default: float) -> float:
@@ -192,10 +243,13 @@ def _as_float(value: str | None, default: float) -> float:
 def _parse_mapping(value: str | None) -> dict[str, str] | None:
     if not value:
         return None
-    try:
-        parsed = json.loads(value)
-    except json.JSONDecodeError:
-        parsed = None
+    parsed = None
+    # Only a JSON object can yield a mapping; skip the decoder for KEY=VALUE text
+    if value.lstrip()[:1] in ("{", "[", '"'):
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            pass
     if parsed is None:
         items: dict[str, str] = {}
         for part in value.split(","):
@@ -217,10 +271,12 @@ def _parse_mapping(value: str | None) -> dict[str, str] | None:
 def _parse_sequence(value: str | None) -> list[str]:
     if not value:
         return []
-    try:
-        parsed = json.loads(value)
-    except json.JSONDecodeError:
-        parsed = None
+    parsed = None
+    if value.lstrip()[:1] in ("[", '"'):
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            pass
     if isinstance(parsed, list):
         return [str(item) for item in parsed]
     if isinstance(parsed, str):
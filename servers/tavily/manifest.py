@@ -6,9 +6,17 @@ loading every wrapper module.
 
 from __future__ import annotations
 
+import json
 from typing import Any, List
 
-TOOLS: List[dict[str, Any]] = [{'_meta': {'_fastmcp': {'tags': []}}, 'description': 'Search the web for real-time information about any topic. Use this tool when you need up-to-date information that might not be available in your training data, or when you need to verify current facts. The search results will include relevant snippets and URLs from web pages. This is particularly useful for questions about current events, technology updates, or any topic that requires recent information.', 'inputSchema': {'properties': {'country': {'default': '', 'description': 'Boost search results from a specific country. This will prioritize content from the selected country in the search results. Available only if topic is general.', 'type': 'string'}, 'days': {'default': 30, 'description': "The number of days back from the current date to include in the search results. This specifies the time frame of data to be retrieved. Please note that this feature is only available when using the 'news' search topic", 'type': 'integer'}, 'end_date': {'default': '', 'description': 'Will return all results before the specified end date ( publish date ). Required to be written in the format YYYY-MM-DD', 'type': 'string'}, 'exclude_domains': {'default': [], 'description': 'List of domains to specifically exclude, if the user asks to exclude a domain set this to the domain of the site', 'items': {'type': 'string'}, 'type': 'array'}, 'include_domains': {'default': [], 'description': 'A list of domains to specifically include in the search results, if the user asks to search on specific sites set this to the domain of the site', 'items': {'type': 'string'}, 'type': 'array'}, 'include_favicon': {'default': False, 'description': 'Whether to include the favicon URL for each result', 'type': 'boolean'}, 'include_image_descriptions': {'default': False, 'description': 'Include a list of query-related images and their descriptions in the response', 'type': 'boolean'}, 'include_images': {'default': False, 'description': 'Include a list of query-related images in the response', 'type': 'boolean'}, 'include_raw_content': {'default': False, 'description': 'Include the cleaned and parsed HTML content of each search result', 'type': 'boolean'}, 'max_results': {'default': 5, 'description': 'The maximum number of search results to return', 'type': 'integer'}, 'query': {'description': 'Search query', 'type': 'string'}, 'search_depth': {'default': 'basic', 'description': "The depth of the search. It can be 'basic' or 'advanced'", 'enum': ['basic', 'advanced'], 'type': 'string'}, 'start_date': {'default': '', 'description': 'Will return all results after the specified start date ( publish date ). Required to be written in the format YYYY-MM-DD', 'type': 'string'}, 'time_range': {'default': 'month', 'description': "The time range back from the current date to include in the search results. This feature is available for both 'general' and 'news' search topics", 'enum': ['day', 'week', 'month', 'year', 'd', 'w', 'm', 'y'], 'type': 'string'}, 'topic': {'default': 'general', 'description': 'The category of the search. This will determine which of our agents will be used for the search', 'enum': ['general', 'news', 'finance'], 'type': 'string'}}, 'required': ['query'], 'type': 'object'}, 'name': 'tavily_search', 'outputSchema': {'additionalProperties': True, 'type': 'object'}}, {'_meta': {'_fastmcp': {'tags': []}}, 'description': 'Extract and process content from specific web pages. Use this tool when you have URLs and need to get the full text content from those pages. Returns clean, structured content in markdown or text format. Useful for reading articles, documentation, or any web page content that you need to analyze or reference.', 'inputSchema': {'properties': {'extract_depth': {'default': 'basic', 'description': "Depth of extraction - 'basic' or 'advanced', if usrls are linkedin use 'advanced' or if explicitly told to use advanced", 'enum': ['basic', 'advanced'], 'type': 'string'}, 'format': {'default': 'markdown', 'description': 'The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.', 'enum': ['markdown', 'text'], 'type': 'string'}, 'include_favicon': {'default': False, 'description': 'Whether to include the favicon URL for each result', 'type': 'boolean'}, 'include_images': {'default': False, 'description': 'Include a list of images extracted from the urls in the response', 'type': 'boolean'}, 'urls': {'description': 'List of URLs to extract content from', 'items': {'type': 'string'}, 'type': 'array'}}, 'required': ['urls'], 'type': 'object'}, 'name': 'tavily_extract', 'outputSchema': {'additionalProperties': True, 'type': 'object'}}, {'_meta': {'_fastmcp': {'tags': []}}, 'description': "Crawl multiple pages from a website starting from a base URL. Use this tool when you need to gather information from multiple related pages across a website or explore a site's structure. It follows internal links and extracts content from multiple pages, but truncates content to 500 characters per page. For full content extraction, use tavily_map to discover URLs first, then tavily_extract to get complete content from specific pages. Useful for comprehensive research on documentation sites, blogs, or when you need to understand the full scope of information available on a website.", 'inputSchema': {'properties': {'allow_external': {'default': True, 'description': 'Whether to return external links in the final response', 'type': 'boolean'}, 'exclude_domains': {'default': [], 'description': 'Regex patterns to exclude URLs from specific domains or subdomains', 'items': {'type': 'string'}, 'type': 'array'}, 'exclude_paths': {'default': [], 'description': 'Regex patterns to exclude URLs from the crawl with specific path patterns', 'items': {'type': 'string'}, 'type': 'array'}, 'extract_depth': {'default': 'basic', 'description': 'Advanced extraction retrieves more data, including tables and embedded content, with higher success but may increase latency', 'enum': ['basic', 'advanced'], 'type': 'string'}, 'format': {'default': 'markdown', 'description': 'The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.', 'enum': ['markdown', 'text'], 'type': 'string'}, 'include_favicon': {'default': False, 'description': 'Whether to include the favicon URL for each result', 'type': 'boolean'}, 'include_images': {'default': False, 'description': 'Whether to include images in the crawl results', 'type': 'boolean'}, 'instructions': {'default': '', 'description': 'Natural language instructions for the crawler. Instructions specify which types of pages the crawler should return.', 'type': 'string'}, 'limit': {'default': 50, 'description': 'Total number of links the crawler will process before stopping', 'minimum': 1, 'type': 'integer'}, 'max_breadth': {'default': 20, 'description': 'Max number of links to follow per level of the graph (i.e., per page)', 'minimum': 1, 'type': 'integer'}, 'max_depth': {'default': 1, 'description': 'Max depth of the crawl. Defines how far from the base URL the crawler can explore.', 'minimum': 1, 'type': 'integer'}, 'select_domains': {'default': [], 'description': 'Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)', 'items': {'type': 'string'}, 'type': 'array'}, 'select_paths': {'default': [], 'description': 'Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)', 'items': {'type': 'string'}, 'type': 'array'}, 'url': {'description': 'The root URL to begin the crawl', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}, 'name': 'tavily_crawl', 'outputSchema': {'additionalProperties': True, 'type': 'object'}}, {'_meta': {'_fastmcp': {'tags': []}}, 'description': "Map and discover the structure of a website by finding all its URLs and pages. Use this tool when you need to understand a website's organization, find specific pages, or get an overview of all available content without extracting the actual text. Returns a structured list of URLs and their relationships. Useful for site exploration, finding documentation pages, or understanding how a website is organized.", 'inputSchema': {'properties': {'allow_external': {'default': True, 'description': 'Whether to return external links in the final response', 'type': 'boolean'}, 'exclude_domains': {'default': [], 'description': 'Regex patterns to exclude URLs from specific domains or subdomains', 'items': {'type': 'string'}, 'type': 'array'}, 'exclude_paths': {'default': [], 'description': 'Regex patterns to exclude URLs from the crawl with specific path patterns', 'items': {'type': 'string'}, 'type': 'array'}, 'instructions': {'default': '', 'description': 'Natural language instructions for the crawler', 'type': 'string'}, 'limit': {'default': 50, 'description': 'Total number of links the crawler will process before stopping', 'minimum': 1, 'type': 'integer'}, 'max_breadth': {'default': 20, 'description': 'Max number of links to follow per level of the graph (i.e., per page)', 'minimum': 1, 'type': 'integer'}, 'max_depth': {'default': 1, 'description': 'Max depth of the mapping. Defines how far from the base URL the crawler can explore', 'minimum': 1, 'type': 'integer'}, 'select_domains': {'default': [], 'description': 'Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\.example\\.com$)', 'items': {'type': 'string'}, 'type': 'array'}, 'select_paths': {'default': [], 'description': 'Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)', 'items': {'type': 'string'}, 'type': 'array'}, 'url': {'description': 'The root URL to begin the mapping', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}, 'name': 'tavily_map', 'outputSchema': {'additionalProperties': True, 'type': 'object'}}]
+_TOOLS_JSON = '[{"_meta":{"_fastmcp":{"tags":[]}},"description":"Search the web for real-time information about any topic. Use this tool when you need up-to-date information that might not be available in your training data, or when you need to verify current facts. The search results will include relevant snippets and URLs from web pages. This is particularly useful for questions about current events, technology updates, or any topic that requires recent information.","inputSchema":{"properties":{"country":{"default":"","description":"Boost search results from a specific country. This will prioritize content from the selected country in the search results. Available only if topic is general.","type":"string"},"days":{"default":30,"description":"The number of days back from the current date to include in the search results. This specifies the time frame of data to be retrieved. Please note that this feature is only available when using the \'news\' search topic","type":"integer"},"end_date":{"default":"","description":"Will return all results before the specified end date ( publish date ). Required to be written in the format YYYY-MM-DD","type":"string"},"exclude_domains":{"default":[],"description":"List of domains to specifically exclude, if the user asks to exclude a domain set this to the domain of the site","items":{"type":"string"},"type":"array"},"include_domains":{"default":[],"description":"A list of domains to specifically include in the search results, if the user asks to search on specific sites set this to the domain of the site","items":{"type":"string"},"type":"array"},"include_favicon":{"default":false,"description":"Whether to include the favicon URL for each result","type":"boolean"},"include_image_descriptions":{"default":false,"description":"Include a list of query-related images and their descriptions in the response","type":"boolean"},"include_images":{"default":false,"description":"Include a list of query-related images in the response","type":"boolean"},"include_raw_content":{"default":false,"description":"Include the cleaned and parsed HTML content of each search result","type":"boolean"},"max_results":{"default":5,"description":"The maximum number of search results to return","type":"integer"},"query":{"description":"Search query","type":"string"},"search_depth":{"default":"basic","description":"The depth of the search. It can be \'basic\' or \'advanced\'","enum":["basic","advanced"],"type":"string"},"start_date":{"default":"","description":"Will return all results after the specified start date ( publish date ). Required to be written in the format YYYY-MM-DD","type":"string"},"time_range":{"default":"month","description":"The time range back from the current date to include in the search results. This feature is available for both \'general\' and \'news\' search topics","enum":["day","week","month","year","d","w","m","y"],"type":"string"},"topic":{"default":"general","description":"The category of the search. This will determine which of our agents will be used for the search","enum":["general","news","finance"],"type":"string"}},"required":["query"],"type":"object"},"name":"tavily_search","outputSchema":{"additionalProperties":true,"type":"object"}},{"_meta":{"_fastmcp":{"tags":[]}},"description":"Extract and process content from specific web pages. Use this tool when you have URLs and need to get the full text content from those pages. Returns clean, structured content in markdown or text format. Useful for reading articles, documentation, or any web page content that you need to analyze or reference.","inputSchema":{"properties":{"extract_depth":{"default":"basic","description":"Depth of extraction - \'basic\' or \'advanced\', if usrls are linkedin use \'advanced\' or if explicitly told to use advanced","enum":["basic","advanced"],"type":"string"},"format":{"default":"markdown","description":"The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.","enum":["markdown","text"],"type":"string"},"include_favicon":{"default":false,"description":"Whether to include the favicon URL for each result","type":"boolean"},"include_images":{"default":false,"description":"Include a list of images extracted from the urls in the response","type":"boolean"},"urls":{"description":"List of URLs to extract content from","items":{"type":"string"},"type":"array"}},"required":["urls"],"type":"object"},"name":"tavily_extract","outputSchema":{"additionalProperties":true,"type":"object"}},{"_meta":{"_fastmcp":{"tags":[]}},"description":"Crawl multiple pages from a website starting from a base URL. Use this tool when you need to gather information from multiple related pages across a website or explore a site\'s structure. It follows internal links and extracts content from multiple pages, but truncates content to 500 characters per page. For full content extraction, use tavily_map to discover URLs first, then tavily_extract to get complete content from specific pages. Useful for comprehensive research on documentation sites, blogs, or when you need to understand the full scope of information available on a website.","inputSchema":{"properties":{"allow_external":{"default":true,"description":"Whether to return external links in the final response","type":"boolean"},"exclude_domains":{"default":[],"description":"Regex patterns to exclude URLs from specific domains or subdomains","items":{"type":"string"},"type":"array"},"exclude_paths":{"default":[],"description":"Regex patterns to exclude URLs from the crawl with specific path patterns","items":{"type":"string"},"type":"array"},"extract_depth":{"default":"basic","description":"Advanced extraction retrieves more data, including tables and embedded content, with higher success but may increase latency","enum":["basic","advanced"],"type":"string"},"format":{"default":"markdown","description":"The format of the extracted web page content. markdown returns content in markdown format. text returns plain text and may increase latency.","enum":["markdown","text"],"type":"string"},"include_favicon":{"default":false,"description":"Whether to include the favicon URL for each result","type":"boolean"},"include_images":{"default":false,"description":"Whether to include images in the crawl results","type":"boolean"},"instructions":{"default":"","description":"Natural language instructions for the crawler. Instructions specify which types of pages the crawler should return.","type":"string"},"limit":{"default":50,"description":"Total number of links the crawler will process before stopping","minimum":1,"type":"integer"},"max_breadth":{"default":20,"description":"Max number of links to follow per level of the graph (i.e., per page)","minimum":1,"type":"integer"},"max_depth":{"default":1,"description":"Max depth of the crawl. Defines how far from the base URL the crawler can explore.","minimum":1,"type":"integer"},"select_domains":{"default":[],"description":"Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\\\.example\\\\.com$)","items":{"type":"string"},"type":"array"},"select_paths":{"default":[],"description":"Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)","items":{"type":"string"},"type":"array"},"url":{"description":"The root URL to begin the crawl","type":"string"}},"required":["url"],"type":"object"},"name":"tavily_crawl","outputSchema":{"additionalProperties":true,"type":"object"}},{"_meta":{"_fastmcp":{"tags":[]}},"description":"Map and discover the structure of a website by finding all its URLs and pages. Use this tool when you need to understand a website\'s organization, find specific pages, or get an overview of all available content without extracting the actual text. Returns a structured list of URLs and their relationships. Useful for site exploration, finding documentation pages, or understanding how a website is organized.","inputSchema":{"properties":{"allow_external":{"default":true,"description":"Whether to return external links in the final response","type":"boolean"},"exclude_domains":{"default":[],"description":"Regex patterns to exclude URLs from specific domains or subdomains","items":{"type":"string"},"type":"array"},"exclude_paths":{"default":[],"description":"Regex patterns to exclude URLs from the crawl with specific path patterns","items":{"type":"string"},"type":"array"},"instructions":{"default":"","description":"Natural language instructions for the crawler","type":"string"},"limit":{"default":50,"description":"Total number of links the crawler will process before stopping","minimum":1,"type":"integer"},"max_breadth":{"default":20,"description":"Max number of links to follow per level of the graph (i.e., per page)","minimum":1,"type":"integer"},"max_depth":{"default":1,"description":"Max depth of the mapping. Defines how far from the base URL the crawler can explore","minimum":1,"type":"integer"},"select_domains":{"default":[],"description":"Regex patterns to restrict crawling to specific domains or subdomains (e.g., ^docs\\\\.example\\\\.com$)","items":{"type":"string"},"type":"array"},"select_paths":{"default":[],"description":"Regex patterns to select only URLs with specific path patterns (e.g., /docs/.*, /api/v1.*)","items":{"type":"string"},"type":"array"},"url":{"description":"The root URL to begin the mapping","type":"string"}},"required":["url"],"type":"object"},"name":"tavily_map","outputSchema":{"additionalProperties":true,"type":"object"}}]'
+
+TOOLS: List[dict[str, Any]] = json.loads(_TOOLS_JSON)
+
+# Lowercased "name\0description" per tool, built once so queries only lowercase themselves
+_SEARCH_INDEX: list[tuple[dict[str, Any], str]] = [
+    (tool, f"{tool.get('name', '')}\0{tool.get('description', '')}".lower()) for tool in TOOLS
+]
 
 
 def search_tools(query: str) -> List[dict[str, Any]]:
@@ -17,13 +25,7 @@ def search_tools(query: str) -> List[dict[str, Any]]:
     normalized = (query or "").strip().lower()
     if not normalized:
         return list(TOOLS)
-    results: list[dict[str, Any]] = []
-    for tool in TOOLS:
-        name = str(tool.get("name", "")).lower()
-        description = str(tool.get("description", "")).lower()
-        if normalized in name or normalized in description:
-            results.append(tool)
-    return results
+    return [tool for tool, blob in _SEARCH_INDEX if normalized in blob]
 
 
 __all__ = ("TOOLS", "search_tools")
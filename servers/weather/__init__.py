@@ -27,6 +27,6 @@ from .get_weather_statistics import get_weather_statistics
 from . import manifest
 
 # Non-sensitive defaults for this provider.
-SERVER_CONFIG = {'args': ['run', 'python', '_mcp_servers/weather_server.py'], 'command': 'uv', 'cwd': None, 'read_timeout': 30.0, 'timeout': 30.0, 'transport': 'stdio'}
+SERVER_CONFIG = {"args":["run","python","_mcp_servers/weather_server.py"],"command":"uv","cwd":None,"read_timeout":30.0,"timeout":30.0,"transport":"stdio"}
 
 __all__ = ("get_current_weather", "get_weather_forecast", "get_hourly_forecast", "get_historical_weather", "get_climate_averages", "get_weather_statistics", "manifest", "SERVER_CONFIG",)
@@ -6,19 +6,26 @@ from pathlib import Path
 from typing import Any
 
 try:
-    from servers._runtime import call_tool
+    from servers._runtime import UNSET, invoke_tool
 except ImportError:  # Modal uploads omit the 'servers' package
     import sys
     root = Path(__file__).resolve().parent.parent
     root_str = str(root)
     if root_str not in sys.path:
         sys.path.append(root_str)
-    from _runtime import call_tool
+    from _runtime import UNSET, invoke_tool
 
-TOOL = {'description': 'Get weather forecast for the next 7 days. Includes daily high/low temperatures, precipitation probability, and conditions.', 'inputSchema': {'properties': {'days': {'default': 7, 'description': 'Number of forecast days (1-16)', 'maximum': 16, 'minimum': 1, 'type': 'integer'}, 'location': {'description': 'City name or location', 'type': 'string'}}, 'required': ['location'], 'type': 'object'}, 'name': 'get_weather_forecast'}
+TOOL = {"description":"Get weather forecast for the next 7 days. Includes daily high/low temperatures, precipitation probability, and conditions.","inputSchema":{"properties":{"days":{"default":7,"description":"Number of forecast days (1-16)","maximum":16,"minimum":1,"type":"integer"},"location":{"description":"City name or location","type":"string"}},"required":["location"],"type":"object"},"name":"get_weather_forecast"}
 
-async def get_weather_forecast(*args: Any, **kwargs: Any) -> Any:
+async def get_weather_forecast(
+    *,
+    location: str,
+    days: int | None = UNSET,
+) -> Any:
     """Get weather forecast for the next 7 days. Includes daily high/low temperatures, precipitation probability, and conditions."""
-    return await call_tool("weather", TOOL, *args, **kwargs)
+    arguments: dict[str, Any] = {"location": location}
+    if days is not UNSET:
+        arguments["days"] = days
+    return await invoke_tool("weather", TOOL, arguments)
 
 __all__ = ('TOOL', 'get_weather_forecast')
@@ -3,22 +3,29 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 try:
-    from servers._runtime import call_tool
+    from servers._runtime import UNSET, invoke_tool
 except ImportError:  # Modal uploads omit the 'servers' package
     import sys
     root = Path(__file__).resolve().parent.parent
     root_str = str(root)
     if root_str not in sys.path:
         sys.path.append(root_str)
-    from _runtime import call_tool
+    from _runtime import UNSET, invoke_tool
 
-TOOL = {'description': 'Get weather statistics for Monte Carlo simulations - temperature ranges, precipitation patterns, and seasonal variations.', 'inputSchema': {'properties': {'location': {'description': 'City name or location', 'type': 'string'}, 'metric': {'default': 'temperature', 'description': 'Weather metric to analyze', 'enum': ['temperature', 'precipitation', 'sunshine', 'wind'], 'type': 'string'}}, 'required': ['location'], 'type': 'object'}, 'name': 'get_weather_statistics'}
+TOOL = {"description":"Get weather statistics for Monte Carlo simulations - temperature ranges, precipitation patterns, and seasonal variations.","inputSchema":{"properties":{"location":{"description":"City name or location","type":"string"},"metric":{"default":"temperature","description":"Weather metric to analyze","enum":["temperature","precipitation","sunshine","wind"],"type":"string"}},"required":["location"],"type":"object"},"name":"get_weather_statistics"}
 
-async def get_weather_statistics(*args: Any, **kwargs: Any) -> Any:
+async def get_weather_statistics(
+    *,
+    location: str,
+    metric: Literal["temperature", "precipitation", "sunshine", "wind"] | None = UNSET,
+) -> Any:
     """Get weather statistics for Monte Carlo simulations - temperature ranges, precipitation patterns, and seasonal variations."""
-    return await call_tool("weather", TOOL, *args, **kwargs)
+    arguments: dict[str, Any] = {"location": location}
+    if metric is not UNSET:
+        arguments["metric"] = metric
+    return await invoke_tool("weather", TOOL, arguments)
 
 __all__ = ('TOOL', 'get_weather_statistics')
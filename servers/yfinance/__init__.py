@@ -29,6 +29,6 @@ from .compare_stocks import compare_stocks
 from . import manifest
 
 # Non-sensitive defaults for this provider.
-SERVER_CONFIG = {'args': ['run', 'python', '_mcp_servers/yfinance_server.py'], 'command': 'uv', 'cwd': None, 'read_timeout': 30.0, 'timeout': 30.0, 'transport': 'stdio'}
+SERVER_CONFIG = {"args":["run","python","_mcp_servers/yfinance_server.py"],"command":"uv","cwd":None,"read_timeout":30.0,"timeout":30.0,"transport":"stdio"}
 
 __all__ = ("get_stock_quote", "get_stock_history", "get_company_info", "get_financial_metrics", "calculate_volatility", "get_market_index", "compare_stocks", "manifest", "SERVER_CONFIG",)
@@ -3,22 +3,28 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 try:
-    from servers._runtime import call_tool
+    from servers._runtime import UNSET, invoke_tool
 except ImportError:  # Modal uploads omit the 'servers' package
     import sys
     root = Path(__file__).resolve().parent.parent
     root_str = str(root)
     if root_str not in sys.path:
         sys.path.append(root_str)
-    from _runtime import call_tool
+    from _runtime import UNSET, invoke_tool
 
-TOOL = {'description': 'Get current data for major market indices (S&P 500, NASDAQ, Dow Jones, etc.)', 'inputSchema': {'properties': {'index': {'default': '^GSPC', 'description': 'Market index to fetch', 'enum': ['^GSPC', '^IXIC', '^DJI', '^RUT', '^VIX'], 'type': 'string'}}, 'required': [], 'type': 'object'}, 'name': 'get_market_index'}
+TOOL = {"description":"Get current data for major market indices (S&P 500, NASDAQ, Dow Jones, etc.)","inputSchema":{"properties":{"index":{"default":"^GSPC","description":"Market index to fetch","enum":["^GSPC","^IXIC","^DJI","^RUT","^VIX"],"type":"string"}},"required":[],"type":"object"},"name":"get_market_index"}
 
-async def get_market_index(*args: Any, **kwargs: Any) -> Any:
+async def get_market_index(
+    *,
+    index: Literal["^GSPC", "^IXIC", "^DJI", "^RUT", "^VIX"] | None = UNSET,
+) -> Any:
     """Get current data for major market indices (S&P 500, NASDAQ, Dow Jones, etc.)"""
-    return await call_tool("yfinance", TOOL, *args, **kwargs)
+    arguments: dict[str, Any] = {}
+    if index is not UNSET:
+        arguments["index"] = index
+    return await invoke_tool("yfinance", TOOL, arguments)
 
 __all__ = ('TOOL', 'get_market_index')
@@ -3,22 +3,32 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 try:
-    from servers._runtime import call_tool
+    from servers._runtime import UNSET, invoke_tool
 except ImportError:  # Modal uploads omit the 'servers' package
     import sys
     root = Path(__file__).resolve().parent.parent
     root_str = str(root)
     if root_str not in sys.path:
         sys.path.append(root_str)
-    from _runtime import call_tool
+    from _runtime import UNSET, invoke_tool
 
-TOOL = {'description': 'Get historical stock price data for a given period. Useful for analyzing trends and volatility for Monte Carlo simulations.', 'inputSchema': {'properties': {'interval': {'default': '1d', 'description': 'Data interval', 'enum': ['1d', '1wk', '1mo'], 'type': 'string'}, 'period': {'default': '1y', 'description': 'Time period for historical data', 'enum': ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'max'], 'type': 'string'}, 'symbol': {'description': "Stock ticker symbol (e.g., 'AAPL', 'GOOGL')", 'type': 'string'}}, 'required': ['symbol'], 'type': 'object'}, 'name': 'get_stock_history'}
+TOOL = {"description":"Get historical stock price data for a given period. Useful for analyzing trends and volatility for Monte Carlo simulations.","inputSchema":{"properties":{"interval":{"default":"1d","description":"Data interval","enum":["1d","1wk","1mo"],"type":"string"},"period":{"default":"1y","description":"Time period for historical data","enum":["1d","5d","1mo","3mo","6mo","1y","2y","5y","10y","max"],"type":"string"},"symbol":{"description":"Stock ticker symbol (e.g., 'AAPL', 'GOOGL')","type":"string"}},"required":["symbol"],"type":"object"},"name":"get_stock_history"}
 
-async def get_stock_history(*args: Any, **kwargs: Any) -> Any:
+async def get_stock_history(
+    *,
+    symbol: str,
+    interval: Literal["1d", "1wk", "1mo"] | None = UNSET,
+    period: Literal["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "max"] | None = UNSET,
+) -> Any:
     """Get historical stock price data for a given period. Useful for analyzing trends and volatility for Monte Carlo simulations."""
-    return await call_tool("yfinance", TOOL, *args, **kwargs)
+    arguments: dict[str, Any] = {"symbol": symbol}
+    if interval is not UNSET:
+        arguments["interval"] = interval
+    if period is not UNSET:
+        arguments["period"] = period
+    return await invoke_tool("yfinance", TOOL, arguments)
 
 __all__ = ('TOOL', 'get_stock_history')
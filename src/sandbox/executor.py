@@ -10,71 +10,177 @@ Usage:
     result = await sandbox.execute_python("print(x)")  # x persists
     result = await sandbox.execute_bash("ls -la")
     await sandbox.terminate()
+
+Independent logical sessions can share one interpreter via named namespaces:
+    await sandbox.execute_python("x = 1", namespace="sim-a")
+    await sandbox.drop_namespace("sim-a")
+
+One-off helpers (run_python/run_bash) check sandboxes out of a warm pool instead:
+    sandbox = await Sandbox.acquire("scratch")
+    try:
+        result = await sandbox.execute_python("print(np.pi)")
+    finally:
+        await sandbox.release()
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import inspect
-import json
 import textwrap
-from dataclasses import dataclass
-from typing import Any, Final
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Final
 
 import modal
+import msgpack
 
 APP_NAME: Final = "monte-carlo"
 VOLUME_NAME: Final = "monte-carlo-mcp"
 SERVERS_MOUNT: Final = "/mnt/servers"
 DEFAULT_TIMEOUT: Final = 120  # 2 minutes per command
+FRAME_HEADER_SIZE: Final = 4  # little-endian payload length prefix
+SANDBOX_LIFETIME: Final = 600  # 10 min sandbox lifetime
+POOL_MIN_WARM: Final = 2  # sandboxes kept ready for acquire()
 
 _PYTHON_SESSION_SCRIPT: Final = textwrap.dedent(
     """
-    import contextlib
-    import io
     import json
+    import os
+    import select
     import sys
+    import threading
+    import time
     import traceback
+    from functools import lru_cache
 
-    NAMESPACE = {}
+    import msgpack
+    import numpy as np
+    import pandas as pd
 
-    def run(code: str) -> dict:
-        buffer_out = io.StringIO()
-        buffer_err = io.StringIO()
-        response = {"ok": True, "stdout": "", "stderr": ""}
+    sys.path.insert(0, "/mnt/servers")
+
+    BASE_NAMESPACE = {"np": np, "pd": pd, "json": json, "sys": sys}
+    NAMESPACES = {}
+    STDIN = sys.stdin.buffer
+    # Private copy of fd 1 so responses bypass the capture pipes installed by run()
+    STDOUT = os.fdopen(os.dup(1), "wb")
+
+    OK_STATUS = msgpack.packb({"ok": True})
+    ERROR_STATUS = msgpack.packb({"ok": False})
+    # How long restore() waits for EOF from background children still holding a pipe
+    EOF_GRACE = 0.25
+    DRAIN_POLL = 0.05
+    TRUNCATED_NOTE = b"\\n[output truncated: a background process still holds this stream]\\n"
+
+    @lru_cache(maxsize=256)
+    def compile_cached(code: str):
+        return compile(code, "<sandbox>", "exec")
+
+    # Point fd at a pipe drained by a thread; the returned callable restores it
+    def capture(fd: int):
+        read_end, write_end = os.pipe()
+        saved = os.dup(fd)
+        os.dup2(write_end, fd)
+        os.close(write_end)
+        # readv() into a reserved buffer that doubles when full: no per-read allocation
+        buffer = bytearray(1 << 16)
+        filled = 0
+        # Set by restore(): give up waiting for EOF at this monotonic time
+        deadline = None
+        truncated = False
+
+        def drain() -> None:
+            nonlocal filled, truncated
+            while True:
+                if deadline is not None and time.monotonic() >= deadline:
+                    truncated = True
+                    break
+                ready, _, _ = select.select([read_end], [], [], DRAIN_POLL)
+                if not ready:
+                    continue
+                if filled == len(buffer):
+                    buffer.extend(bytes(len(buffer)))
+                with memoryview(buffer) as view:
+                    count = os.readv(read_end, [view[filled:]])
+                if not count:
+                    break
+                filled += count
+            # Always release the read end; late writers get EPIPE instead of a leak
+            os.close(read_end)
+
+        thread = threading.Thread(target=drain, daemon=True)
+        thread.start()
+
+        def restore() -> bytes:
+            nonlocal deadline
+            os.dup2(saved, fd)
+            os.close(saved)
+            # Background children may still hold the pipe open; wait briefly, then cut off
+            deadline = time.monotonic() + EOF_GRACE
+            thread.join()
+            output = buffer[:filled]
+            if truncated:
+                output += TRUNCATED_NOTE
+            return output
+
+        return restore
+
+    def run(code: str, namespace: dict) -> tuple[bytes, bytes, bytes]:
+        restore_out = capture(1)
+        restore_err = capture(2)
+        status = OK_STATUS
         try:
-            with contextlib.redirect_stdout(buffer_out), contextlib.redirect_stderr(buffer_err):
-                exec(compile(code, "<sandbox>", "exec"), NAMESPACE, NAMESPACE)
+            exec(compile_cached(code), namespace, namespace)
         except Exception:  # noqa: BLE001 - propagate traceback to stderr
-            response["ok"] = False
-            traceback.print_exc(file=buffer_err)
-        response["stdout"] = buffer_out.getvalue()
-        response["stderr"] = buffer_err.getvalue()
-        return response
-
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        message = json.loads(line)
+            status = ERROR_STATUS
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            stderr = restore_err()
+            stdout = restore_out()
+        return status, stdout, stderr
+
+    def read_message() -> dict | None:
+        header = STDIN.read(4)
+        if len(header) < 4:
+            return None
+        return msgpack.unpackb(STDIN.read(int.from_bytes(header, "little")), raw=False)
+
+    def write_response(status: bytes, stdout: bytes = b"", stderr: bytes = b"") -> None:
+        for part in (status, stdout, stderr):
+            STDOUT.write(len(part).to_bytes(4, "little"))
+            STDOUT.write(part)
+        STDOUT.flush()
+
+    while True:
+        message = read_message()
+        if message is None:
+            break
         if message.get("_terminate"):
-            print(json.dumps({"ok": True, "stdout": "", "stderr": ""}), flush=True)
+            write_response(OK_STATUS)
             break
-        payload = run(message.get("code", ""))
-        print(json.dumps(payload), flush=True)
+        if message.get("_reset"):
+            NAMESPACES.clear()
+            write_response(OK_STATUS)
+            continue
+        if "_drop_ns" in message:
+            NAMESPACES.pop(message["_drop_ns"], None)
+            write_response(OK_STATUS)
+            continue
+        ns = message.get("ns", "")
+        namespace = NAMESPACES.get(ns)
+        if namespace is None:
+            namespace = NAMESPACES[ns] = dict(BASE_NAMESPACE)
+        write_response(*run(message.get("code", ""), namespace))
     """
 )
 
-_PYTHON_SESSION_INIT: Final = textwrap.dedent(
-    """
-    import numpy as np
-    import pandas as pd
-    import json
-    import sys
-    sys.path.insert(0, '/mnt/servers')
-    """
-)
+_TERMINATE_MESSAGE: Final = msgpack.packb({"_terminate": True})
 
 
 @dataclass(slots=True)
@@ -87,38 +193,84 @@ class ExecutionResult:
     error: str | None = None
 
 
+@functools.cache
 def _build_image() -> modal.Image:
     """Build sandbox image with the runtime and dependencies we need."""
-    return modal.Image.debian_slim(python_version="3.12").pip_install(
-        # IPython remains available if needed for debugging
-        "ipython>=8.0.0",
-        # Data/simulation
-        "numpy>=2.0.0",
-        "pandas>=2.0.0",
-        # Finance
-        "yfinance>=0.2.66",
-        # HTTP for MCP
-        "httpx>=0.28.1",
-        "aiohttp>=3.11.0",
-        # MCP runtime
-        "mcp>=1.22.0",
-        "pydantic-ai-slim",
+    return (
+        modal.Image.debian_slim(python_version="3.12")
+        .pip_install(
+            # IPython remains available if needed for debugging
+            "ipython>=8.0.0",
+            # Data/simulation
+            "numpy>=2.0.0",
+            "pandas>=2.0.0",
+            # Finance
+            "yfinance>=0.2.66",
+            # HTTP for MCP
+            "httpx>=0.28.1",
+            "aiohttp>=3.11.0",
+            # MCP runtime
+            "mcp>=1.22.0",
+            "pydantic-ai-slim",
+            # Session IPC
+            "msgpack>=1.1.0",
+        )
+        # Compile bytecode for the session's heavy imports into the image layer
+        .run_commands("python -c 'import numpy, pandas, yfinance'")
     )
 
 
+_APP_CACHE: modal.App | None = None
+_VOLUME_CACHE: dict[str, modal.Volume] = {}
+
+
+async def _lookup_app() -> modal.App:
+    """Look up the Modal app once per process.
+
+    No lock: concurrent first calls may each do a (harmless) lookup, and an asyncio
+    lock here would be bound to whichever event loop first contended for it.
+    """
+    global _APP_CACHE
+    if _APP_CACHE is None:
+        _APP_CACHE = await modal.App.lookup.aio(APP_NAME, create_if_missing=True)
+    return _APP_CACHE
+
+
+async def _lookup_volume(name: str) -> modal.Volume:
+    """Resolve the named Modal volume once per process."""
+    volume = _VOLUME_CACHE.get(name)
+    if volume is None:
+        volume = modal.Volume.from_name(name, create_if_missing=True)
+        await volume.hydrate.aio()
+        _VOLUME_CACHE[name] = volume
+    return volume
+
+
 class Sandbox:
     """Per-model sandbox with persistent Python and Bash execution."""
 
-    def __init__(self, session_id: str, sandbox: modal.Sandbox) -> None:
+    def __init__(
+        self,
+        session_id: str,
+        sandbox: modal.Sandbox,
+        expires_at: float = float("inf"),
+    ) -> None:
         self.session_id = session_id
         self._sandbox = sandbox
+        self._expires_at = expires_at
         self._python_proc: Any | None = None
+        self._python_buffer = bytearray()
+        self._read_one: Callable[[], Awaitable[bytes | str]] | None = None
+        self._session_lock = asyncio.Lock()
+        self._io_lock = asyncio.Lock()
+        # Set when a round trip was abandoned mid-read; the pipe then holds a stale reply
+        self._desynced = False
 
     @classmethod
     async def create(
         cls,
         session_id: str,
-        timeout: int = 600,  # 10 min sandbox lifetime
+        timeout: int = SANDBOX_LIFETIME,
     ) -> "Sandbox":
         """Create a new sandbox for a model session.
 
@@ -126,15 +278,18 @@ class Sandbox:
             session_id: Unique ID (e.g., "claude-user123", "gpt-user123")
             timeout: Sandbox lifetime in seconds
         """
-        app = modal.App.lookup(APP_NAME, create_if_missing=True)
+        # App and servers volume lookups are independent control-plane calls
+        app, volume = await asyncio.gather(
+            _lookup_app(),
+            _lookup_volume(VOLUME_NAME),
+            return_exceptions=True,
+        )
+        if isinstance(app, BaseException):
+            raise app
         image = _build_image()
 
-        # Get servers volume
-        try:
-            volume = modal.Volume.from_name(VOLUME_NAME, create_if_missing=True)
-            volumes = {SERVERS_MOUNT: volume}
-        except Exception:  # noqa: BLE001 - fall back to ephemeral volume
-            volumes = {}
+        # Fall back to an ephemeral filesystem if the servers volume is unavailable
+        volumes = {} if isinstance(volume, BaseException) else {SERVERS_MOUNT: volume}
 
         sb = await modal.Sandbox.create.aio(
             app=app,
@@ -145,34 +300,98 @@ class Sandbox:
             volumes=volumes,
         )
 
-        return cls(session_id, sb)
+        return cls(session_id, sb, expires_at=time.monotonic() + timeout)
+
+    @classmethod
+    async def acquire(cls, session_id: str) -> "Sandbox":
+        """Check a warm sandbox out of the pool, creating one if the pool is empty.
+
+        The returned sandbox already has its Python session running with the
+        standard imports loaded. Hand it back with ``release()`` when done.
+
+        Pooled sandboxes are reused across session IDs. Only the Python namespaces
+        are reset between callers: interpreter-wide state (``sys.modules``,
+        ``os.environ``, numpy's global RNG, background threads) and files written
+        to the sandbox filesystem carry over from earlier runs.
+        """
+        pool = _current_pool()
+        _ensure_pool_replenisher(pool)
+        try:
+            while True:
+                sandbox = pool.queue.get_nowait()
+                pool.wanted.set()
+                # Skip sandboxes that could expire mid-command
+                if sandbox._expires_at - time.monotonic() > DEFAULT_TIMEOUT:
+                    break
+                await sandbox.terminate()
+        except asyncio.QueueEmpty:
+            pool.wanted.set()
+            sandbox = await cls.create(session_id)
+        sandbox.session_id = session_id
+        return sandbox
+
+    async def release(self) -> None:
+        """Drop all Python namespaces and return the sandbox to the warm pool.
+
+        Sandboxes whose last call timed out (the interpreter may still be running
+        it), that fail to reset, or that arrive when the pool is already full are
+        terminated instead. The reset does not undo process-wide or filesystem
+        side effects; see ``acquire()``.
+        """
+        pool = _current_pool()
+        try:
+            if self._desynced:
+                raise RuntimeError("Python session is out of sync")
+            await self._ensure_python_session()
+            await self._communicate_with_python({"_reset": True}, DEFAULT_TIMEOUT)
+            if pool.queue.qsize() >= POOL_MIN_WARM:
+                raise RuntimeError("Sandbox pool is full")
+        except Exception:  # noqa: BLE001 - never pool an unhealthy sandbox
+            with contextlib.suppress(Exception):
+                await self.terminate()
+            return
+        pool.queue.put_nowait(self)
 
     async def execute_python(
         self,
         code: str,
         timeout: int = DEFAULT_TIMEOUT,
+        namespace: str = "",
     ) -> ExecutionResult:
-        """Execute Python code in a persistent interpreter."""
+        """Execute Python code in a persistent interpreter.
 
+        Args:
+            code: Source to execute
+            timeout: Seconds to wait for the result
+            namespace: Globals to run in; each name is an isolated logical session
+                sharing this sandbox's interpreter (default: the sandbox's own)
+        """
+
+        message = {"code": code, "ns": namespace}
         last_error: Exception | None = None
         for attempt in range(2):
+            proc = None
             try:
-                await self._ensure_python_session(timeout)
-                response = await self._communicate_with_python({"code": code}, timeout)
-                return ExecutionResult(
-                    success=bool(response.get("ok", False)),
-                    stdout=response.get("stdout", ""),
-                    stderr=response.get("stderr", ""),
-                )
+                await self._ensure_python_session()
+                proc = self._python_proc
+                return await self._communicate_with_python(message, timeout)
             except asyncio.TimeoutError:
                 return ExecutionResult(success=False, error=f"Timeout after {timeout}s")
             except Exception as exc:  # noqa: BLE001 - surface sandbox errors
                 last_error = exc
-                await self._restart_python_session(timeout)
+                await self._restart_python_session(proc)
 
         error_message = str(last_error) if last_error else "Python session failed"
         return ExecutionResult(success=False, error=error_message)
 
+    async def drop_namespace(self, namespace: str, timeout: int = DEFAULT_TIMEOUT) -> None:
+        """Free a namespace created by ``execute_python(..., namespace=...)``."""
+
+        # A desynced interpreter is replaced wholesale, namespaces included
+        if self._python_proc is None or self._desynced:
+            return
+        await self._communicate_with_python({"_drop_ns": namespace}, timeout)
+
     async def execute_bash(
         self,
         command: str,
@@ -187,9 +406,12 @@ class Sandbox:
                 command,
                 timeout=timeout,
             )
-            stdout_bytes = await self._read_stream(process.stdout)
-            stderr_bytes = await self._read_stream(process.stderr)
-            await process.wait.aio()
+            # Drain both pipes together so a chatty stderr cannot stall stdout
+            stdout_bytes, stderr_bytes, _ = await asyncio.gather(
+                self._read_stream(process.stdout),
+                self._read_stream(process.stderr),
+                process.wait.aio(),
+            )
 
             return ExecutionResult(
                 success=getattr(process, "returncode", 0) == 0,
@@ -207,37 +429,56 @@ class Sandbox:
                 error=str(exc),
             )
 
-    async def _ensure_python_session(self, timeout: int) -> None:
-        """Start the persistent Python session if it is not running."""
+    async def _ensure_python_session(self) -> None:
+        """Start the persistent Python session if it is not running or is out of sync."""
 
-        if self._python_proc is not None:
+        if self._python_proc is not None and not self._desynced:
             return
-        await self._start_python_session(timeout)
+        async with self._session_lock:
+            if self._desynced:
+                await self._stop_python_session()
+            if self._python_proc is None:
+                await self._start_python_session()
+
+    async def _start_python_session(self) -> None:
+        """Launch the long-lived Python interpreter process.
 
-    async def _start_python_session(self, timeout: int) -> None:
-        """Launch the long-lived Python interpreter process."""
+        The process may sit idle between commands (e.g. warm in the pool), so it is
+        bounded by the sandbox's remaining lifetime rather than a per-command timeout.
+        """
 
+        remaining = self._expires_at - time.monotonic()
         self._python_proc = await self._sandbox.exec.aio(
             "python3",
             "-u",
             "-c",
             _PYTHON_SESSION_SCRIPT,
-            timeout=timeout,
+            timeout=max(1, int(remaining)) if remaining != float("inf") else None,
+            text=False,
         )
-        await self._communicate_with_python({"code": _PYTHON_SESSION_INIT}, timeout)
+        self._python_buffer.clear()
+        self._read_one = self._pick_reader(self._python_proc.stdout)
+        self._desynced = False
 
-    async def _restart_python_session(self, timeout: int) -> None:
-        """Restart the Python session if it dies or becomes unhealthy."""
+    async def _restart_python_session(self, failed: Any | None) -> None:
+        """Restart the Python session if it dies or becomes unhealthy.
 
-        await self._stop_python_session()
-        await self._start_python_session(timeout)
+        ``failed`` is the process the caller saw fail. Concurrent callers can fail on
+        the same process; only the first restarts it, the rest reuse the replacement.
+        """
+
+        async with self._session_lock:
+            if failed is not None and self._python_proc is not failed:
+                return
+            await self._stop_python_session()
+            await self._start_python_session()
 
     async def _communicate_with_python(
         self,
         payload: dict[str, Any],
         timeout: int,
-    ) -> dict[str, Any]:
-        """Send a JSON payload to the Python session and await the response."""
+    ) -> ExecutionResult:
+        """Send a framed msgpack payload to the Python session and await the response."""
 
         if self._python_proc is None:
             raise RuntimeError("Python session is not initialized")
@@ -247,23 +488,62 @@ class Sandbox:
         if stdin is None or stdout is None:
             raise RuntimeError("Python session streams are unavailable")
 
-        message = json.dumps(payload).encode("utf-8") + b"\n"
-        stdin.write(message)
+        # Requests from different namespaces share one pipe; keep each round trip whole
+        async with self._io_lock:
+            if self._desynced:
+                raise RuntimeError("Python session is out of sync")
+            try:
+                await self._send_frame(stdin, msgpack.packb(payload, use_bin_type=True))
+                async with asyncio.timeout(timeout):
+                    return await self._read_response()
+            except BaseException:
+                # Timeout, cancellation or a broken stream: the reply (or the rest of
+                # it) may still arrive, so nothing further can be read from this pipe
+                self._desynced = True
+                raise
+
+    async def _send_frame(self, stdin: Any, body: bytes) -> None:
+        """Write one framed message to the Python session in a single write."""
+
+        stdin.write(self._frame(body))
+        # Modal buffers writes client-side; drain is what actually transmits them
         await stdin.drain.aio()
 
-        try:
-            line = await asyncio.wait_for(self._readline(stdout), timeout=timeout)
-        except asyncio.TimeoutError:
-            raise
+    async def _read_response(self) -> ExecutionResult:
+        """Read a status frame followed by raw stdout and stderr frames."""
 
-        if not line:
-            raise RuntimeError("Python session terminated unexpectedly")
+        status = msgpack.unpackb(await self._read_frame(), raw=False)
+        stdout = await self._read_frame()
+        stderr = await self._read_frame()
+        return ExecutionResult(
+            success=bool(status.get("ok", False)),
+            stdout=self._decode_stream(stdout),
+            stderr=self._decode_stream(stderr),
+        )
 
-        decoded = self._decode_stream(line).strip()
-        if not decoded:
-            return {"ok": True, "stdout": "", "stderr": ""}
+    async def _read_frame(self) -> bytes:
+        """Read one length-prefixed frame from the Python session."""
 
-        return json.loads(decoded)
+        header = await self._read_exact(FRAME_HEADER_SIZE)
+        return await self._read_exact(int.from_bytes(header, "little"))
+
+    async def _read_exact(self, size: int) -> bytes:
+        """Read exactly ``size`` bytes, buffering any surplus for the next frame."""
+
+        buffer = self._python_buffer
+        read_one = self._read_one
+        if read_one is None:
+            raise RuntimeError("Python session is not initialized")
+        while len(buffer) < size:
+            chunk = await read_one()
+            if not chunk:
+                raise RuntimeError("Python session terminated unexpectedly")
+            buffer += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        # Copy straight out of the buffer; slicing the bytearray first would copy twice
+        with memoryview(buffer) as view:
+            data = view[:size].tobytes()
+        del buffer[:size]
+        return data
 
     async def _read_stream(self, stream: Any) -> bytes | str:
         """Read from a sandbox stream, handling sync/async readers."""
@@ -278,37 +558,33 @@ class Sandbox:
             return await data
         return data
 
-    async def _readline(self, stream: Any) -> bytes | str:
-        """Read a single line (best effort) from the sandbox stream."""
-
-        if stream is None:
-            return b""
+    def _pick_reader(self, stream: Any) -> Callable[[], Awaitable[bytes | str]]:
+        """Resolve how to pull chunks from ``stream`` once, at session start."""
 
         anext_fn = getattr(stream, "__anext__", None)
+        if anext_fn is None and hasattr(stream, "__aiter__"):
+            anext_fn = getattr(stream.__aiter__(), "__anext__", None)
         if anext_fn is not None:
-            try:
-                return await anext_fn()
-            except StopAsyncIteration:
-                return b""
-
-        aiter_fn = getattr(stream, "__aiter__", None)
-        if aiter_fn is not None:
-            iterator = aiter_fn()
-            anext_fn = getattr(iterator, "__anext__", None)
-            if anext_fn is not None:
+
+            async def read_next() -> bytes | str:
                 try:
                     return await anext_fn()
                 except StopAsyncIteration:
                     return b""
 
-        readline_fn = getattr(stream, "readline", None)
-        if readline_fn is not None:
-            data = readline_fn()
+            return read_next
+
+        read_fn = getattr(stream, "readline", None)
+        if read_fn is None:
+            return functools.partial(self._read_stream, stream)
+
+        async def read_line() -> bytes | str:
+            data = read_fn()
             if inspect.isawaitable(data):
                 return await data
             return data
 
-        return await self._read_stream(stream)
+        return read_line
 
     async def _stop_python_session(self) -> None:
         """Stop the persistent Python process if it is running."""
@@ -316,21 +592,41 @@ class Sandbox:
         if self._python_proc is None:
             return
 
+        if self._desynced:
+            # The interpreter may still be busy with the abandoned call; a graceful
+            # handshake would block on it. Close its stdin so it exits once idle.
+            stdin = getattr(self._python_proc, "stdin", None)
+            with contextlib.suppress(Exception):
+                stdin.write_eof()
+                await stdin.drain.aio()
+            self._python_proc = None
+            self._read_one = None
+            return
+
         stdin = getattr(self._python_proc, "stdin", None)
         stdout = getattr(self._python_proc, "stdout", None)
         try:
-            if stdin is not None:
-                stdin.write(b'{"_terminate": true}\n')
-                await stdin.drain.aio()
-            if stdout is not None:
-                with contextlib.suppress(asyncio.TimeoutError):
-                    await asyncio.wait_for(self._readline(stdout), timeout=5)
+            # The handshake shares the pipe with in-flight round trips; don't interleave
+            async with self._io_lock:
+                if stdin is not None:
+                    await self._send_frame(stdin, _TERMINATE_MESSAGE)
+                if stdout is not None:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        async with asyncio.timeout(5):
+                            await self._read_response()
         except Exception:  # noqa: BLE001 - best effort shutdown
             pass
         finally:
             with contextlib.suppress(Exception):
                 await self._python_proc.wait.aio()
             self._python_proc = None
+            self._read_one = None
+
+    @staticmethod
+    def _frame(payload: bytes) -> bytes:
+        """Prefix ``payload`` with its little-endian length header."""
+
+        return len(payload).to_bytes(FRAME_HEADER_SIZE, "little") + payload
 
     @staticmethod
     def _decode_stream(data: bytes | bytearray | str | None) -> str:
@@ -353,20 +649,119 @@ class Sandbox:
         return self._sandbox.object_id
 
 
+@dataclass(slots=True)
+class _WarmPool:
+    """Warm pool backing Sandbox.acquire/release for one event loop."""
+
+    queue: asyncio.Queue[Sandbox] = field(default_factory=asyncio.Queue)
+    wanted: asyncio.Event = field(default_factory=asyncio.Event)
+    replenisher: asyncio.Task[None] | None = None
+
+
+# asyncio primitives (and sandboxes created on a loop) cannot cross event loops, and
+# callers such as app.py run a fresh loop per request, so pools are kept per loop.
+_POOLS: dict[asyncio.AbstractEventLoop, _WarmPool] = {}
+
+
+# Strong references to fire-and-forget cleanup tasks so they are not collected early
+_CLEANUP_TASKS: set[asyncio.Task[None]] = set()
+
+
+def _current_pool() -> _WarmPool:
+    """Return the running loop's pool, discarding pools of loops that have closed."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        for stale in [other for other in _POOLS if other.is_closed()]:
+            _discard_pool(_POOLS.pop(stale))
+        pool = _POOLS[loop] = _WarmPool()
+    return pool
+
+
+def _discard_pool(pool: _WarmPool) -> None:
+    """Stop a dead loop's replenisher and terminate its queued sandboxes from this loop.
+
+    Normally ``_replenish_pool`` drains the pool itself when ``asyncio.run`` cancels it
+    at shutdown; this catches loops that were closed without cancelling their tasks.
+    """
+    if pool.replenisher is not None:
+        # Cancelling a task of a closed loop can fail; it is dead either way
+        with contextlib.suppress(RuntimeError):
+            pool.replenisher.cancel()
+    if pool.queue.empty():
+        return
+    task = asyncio.create_task(_close_pool(pool))
+    _CLEANUP_TASKS.add(task)
+    task.add_done_callback(_CLEANUP_TASKS.discard)
+
+
+async def _close_pool(pool: _WarmPool) -> None:
+    """Terminate every sandbox still queued in ``pool``.
+
+    The sandboxes are killed outright: their interpreters are idle, and the
+    Python-session handshake may belong to another (possibly closed) event loop.
+    """
+    sandboxes: list[Sandbox] = []
+    while not pool.queue.empty():
+        sandboxes.append(pool.queue.get_nowait())
+    await asyncio.gather(
+        *(sandbox._sandbox.terminate.aio() for sandbox in sandboxes),
+        return_exceptions=True,
+    )
+
+
+def _ensure_pool_replenisher(pool: _WarmPool) -> None:
+    """Start the background task that keeps the pool topped up."""
+    if pool.replenisher is None or pool.replenisher.done():
+        pool.replenisher = asyncio.create_task(_replenish_pool(pool))
+
+
+async def _replenish_pool(pool: _WarmPool) -> None:
+    """Keep at least POOL_MIN_WARM sandboxes with a live Python session queued.
+
+    When the task is cancelled (``asyncio.run`` does so for leftover tasks before it
+    closes the loop) the queued sandboxes are terminated instead of being leaked.
+    """
+    try:
+        while True:
+            pool.wanted.clear()
+            while pool.queue.qsize() < POOL_MIN_WARM:
+                sandbox: Sandbox | None = None
+                try:
+                    sandbox = await Sandbox.create("warm-pool")
+                    await sandbox._ensure_python_session()
+                except BaseException as exc:
+                    # Don't leak a sandbox whose session failed to start (or was cancelled)
+                    if sandbox is not None:
+                        with contextlib.suppress(Exception):
+                            await sandbox._sandbox.terminate.aio()
+                    if not isinstance(exc, Exception):
+                        raise
+                    break  # retry on the next checkout
+                pool.queue.put_nowait(sandbox)
+            await pool.wanted.wait()
+    except asyncio.CancelledError:
+        await _close_pool(pool)
+        raise
+
+
 # Convenience functions for one-off execution
 async def run_python(code: str, session_id: str = "default") -> ExecutionResult:
-    """Run Python code in a temporary sandbox."""
-    sandbox = await Sandbox.create(session_id)
+    """Run Python code in a throwaway namespace of a pooled sandbox."""
+    sandbox = await Sandbox.acquire(session_id)
+    namespace = f"{session_id}-{uuid.uuid4().hex}"
     try:
-        return await sandbox.execute_python(code)
+        return await sandbox.execute_python(code, namespace=namespace)
     finally:
-        await sandbox.terminate()
+        with contextlib.suppress(Exception):
+            await sandbox.drop_namespace(namespace)
+        await sandbox.release()
 
 
 async def run_bash(command: str, session_id: str = "default") -> ExecutionResult:
-    """Run bash command in a temporary sandbox."""
-    sandbox = await Sandbox.create(session_id)
+    """Run bash command in a pooled sandbox."""
+    sandbox = await Sandbox.acquire(session_id)
     try:
         return await sandbox.execute_bash(command)
     finally:
-        await sandbox.terminate()
+        await sandbox.release()
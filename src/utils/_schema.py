@@ -0,0 +1,105 @@
+"""JSON Schema → TypedDict rendering shared by the CLI and the sandbox helpers.
+
+The CLI uses it to write ``interfaces.py`` and copies this file verbatim to
+``servers/_schema.py`` so ``_code_mode`` can import the same implementation inside
+the sandbox. Keep it standard-library only.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any, Callable, TextIO
+
+
+def json_type_to_python(schema: dict[str, Any]) -> str:
+    """Convert JSON Schema type to Python type annotation."""
+    if not schema:
+        return "Any"
+    if "enum" in schema:
+        # json.dumps yields a valid double-quoted Python string literal, escapes included
+        literals = ", ".join(
+            json.dumps(v if isinstance(v, str) else str(v), ensure_ascii=False)
+            for v in schema["enum"]
+        )
+        return f"Literal[{literals}]"
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        return " | ".join(json_type_to_python({"type": t}) for t in schema_type)
+    if not isinstance(schema_type, str):
+        return "Any"
+    mapped = _JSON_TYPE_MAPPING.get(schema_type)
+    if mapped is not None:
+        return mapped
+    return _TYPE_HANDLERS.get(schema_type, _any_type)(schema)
+
+
+def typed_dict_source(class_name: str, schema: dict[str, Any], description: str = "") -> str:
+    """Convert JSON Schema to a newline-terminated TypedDict class definition."""
+    buf = io.StringIO()
+    write_typed_dict(buf, class_name, schema, description)
+    return buf.getvalue()
+
+
+def write_typed_dict(
+    out: TextIO, class_name: str, schema: dict[str, Any], description: str = ""
+) -> None:
+    """Write the ``typed_dict_source`` text straight into ``out`` (e.g. a whole interfaces file)."""
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", []))
+
+    if description:
+        out.write(f"# {_collapse(description)}\n")
+
+    out.write(f"class {class_name}(TypedDict):\n")
+
+    if not properties:
+        out.write("    pass  # No parameters required\n")
+        return
+
+    for prop_name, prop_schema in properties.items():
+        prop_type = json_type_to_python(prop_schema)
+        if prop_name not in required:
+            prop_type = f"Optional[{prop_type}]"
+        prop_desc = prop_schema.get("description", "")
+
+        # One write per property: optional comment line plus the annotation
+        if prop_desc:
+            out.write(f"    # {_collapse(prop_desc)[:80]}\n    {prop_name}: {prop_type}\n")
+        else:
+            out.write(f"    {prop_name}: {prop_type}\n")
+
+
+def _collapse(text: str) -> str:
+    return " ".join(str(text).split())
+
+
+def _any_type(schema: dict[str, Any]) -> str:
+    return "Any"
+
+
+def _array_type(schema: dict[str, Any]) -> str:
+    return f"List[{json_type_to_python(schema.get('items', {}))}]"
+
+
+def _object_type(schema: dict[str, Any]) -> str:
+    additional = schema.get("additionalProperties")
+    if additional and isinstance(additional, dict):
+        return f"dict[str, {json_type_to_python(additional)}]"
+    return "dict[str, Any]"
+
+
+_JSON_TYPE_MAPPING: dict[str, str] = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+    "null": "None",
+}
+
+# Jump table for the JSON Schema "type" values that need the rest of the schema.
+_TYPE_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "array": _array_type,
+    "object": _object_type,
+}
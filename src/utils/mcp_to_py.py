@@ -3,19 +3,44 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-import importlib.util
+import ast
+import io
 import json
+import keyword
 import re
-import shutil
-import textwrap
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
 from pydantic_ai.mcp import MCPServerStdio, MCPServerStreamableHTTP
 
+from src.utils._schema import json_type_to_python, write_typed_dict
+
 DEFAULT_OUTPUT_DIR = Path("servers")
 RUNTIME_MODULE_NAME = "_runtime.py"
+SCHEMA_MODULE_NAME = "_schema.py"
+
+_NON_UPPER_ALNUM = re.compile(r"[^0-9A-Z]+")
+
+# Matches a whole JSON string token (left untouched) or a bare JSON constant.
+_JSON_CONSTANT = re.compile(r'"(?:[^"\\]|\\.)*"|\b(true|false|null)\b')
+_PYTHON_CONSTANTS = {"true": "True", "false": "False", "null": "None"}
+
+
+class _IdentifierTable(dict):
+    """str.translate table: ASCII letters/digits map to themselves, everything else to a space."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return " "
+
+
+_IDENTIFIER_TABLE = _IdentifierTable(
+    (ord(c), c) for c in "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+# Backslash and double quote escaped in one str.translate pass for .env values.
+_ENV_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,6 +70,15 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Upload the generated folder to the shared Modal volume.",
     )
+    parser.add_argument(
+        "--emit-interfaces",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Write interfaces.py with TypedDicts for each tool (default: on, off with"
+            " --modal-upload since sandboxes read schemas from manifest.py)."
+        ),
+    )
 
     subparsers = parser.add_subparsers(
         required=True,
@@ -132,9 +166,7 @@ async def fetch_tools(
             "read_timeout": args.read_timeout,
         }
         if headers:
-            secret_env[f"MCP_SERVER_{env_prefix}_HEADERS"] = json.dumps(
-                headers, separators=(",", ":")
-            )
+            secret_env[f"MCP_SERVER_{env_prefix}_HEADERS"] = _dumps(headers)
     elif args.transport == "stdio":
         env = _parse_key_values(args.env, "env")
         server = MCPServerStdio(
@@ -154,14 +186,18 @@ async def fetch_tools(
             "read_timeout": args.read_timeout,
         }
         if env:
-            secret_env[f"MCP_SERVER_{env_prefix}_ENV"] = json.dumps(env, separators=(",", ":"))
+            secret_env[f"MCP_SERVER_{env_prefix}_ENV"] = _dumps(env)
     else:  # pragma: no cover - guarded by argparse
         raise ValueError(f"Unsupported transport: {args.transport}")
 
     tools = list(await server.list_tools())
     info_name = None
-    if hasattr(server, "server_info") and server.server_info is not None:
-        info_name = getattr(server.server_info, "name", None)
+    try:
+        server_info = server.server_info
+        if server_info is not None:
+            info_name = server_info.name
+    except AttributeError:
+        pass
     server_name = args.provider_title or info_name or args.provider
     return tools, server_name, transport_config, secret_env
 
@@ -172,54 +208,115 @@ def sync_to_disk(
     tools: Iterable[Any],
     output_dir: Path,
     transport_config: dict[str, Any],
+    emit_interfaces: bool = True,
 ) -> tuple[Path, int]:
     """Write each tool definition to disk as a minimal Python module."""
 
     base_dir = output_dir.resolve()
     base_dir.mkdir(parents=True, exist_ok=True)
     _write_runtime_module(base_dir)
+    _write_schema_module(base_dir)
     root_init = base_dir / "__init__.py"
     if not root_init.exists():
         root_init.write_text('"""MCP tool packages."""\n', encoding="utf-8")
 
     provider_dir = base_dir / provider
-    if provider_dir.exists():
-        shutil.rmtree(provider_dir)
     provider_dir.mkdir(parents=True, exist_ok=True)
 
     module_names: list[str] = []
     tool_entries: list[dict[str, Any]] = []
+    tool_jsons: list[str] = []
+    pending: list[tuple[Path, str]] = []
     for tool in tools:
         module_name = _slugify(tool.name)
-        module_path = provider_dir / f"{module_name}.py"
         tool_data = tool.model_dump(mode="json", by_alias=True, exclude_none=True)
-        module_content = _render_tool_module(provider, provider_title, tool_data)
-        module_path.write_text(module_content, encoding="utf-8")
+        # Serialize once; the manifest embeds the JSON, the module its Python spelling
+        tool_json = _dumps(tool_data, sort_keys=True)
+        tool_literal = _json_to_literal(tool_json)
+        module_content = _render_tool_module(provider, provider_title, tool_data, tool_literal)
+        pending.append((provider_dir / f"{module_name}.py", module_content))
         module_names.append(module_name)
         tool_entries.append(tool_data)
+        tool_jsons.append(tool_json)
+    _write_files(pending)
 
-    (provider_dir / "__init__.py").write_text(
+    _write_if_changed(
+        provider_dir / "__init__.py",
         _render_provider_init(provider, provider_title, module_names, transport_config),
-        encoding="utf-8",
     )
-    _write_manifest(provider_dir, provider, tool_entries)
-    _write_interfaces(provider_dir, provider, tool_entries)
+    _write_manifest(provider_dir, provider, tool_jsons)
+    keep = {path.name for path, _ in pending} | {"__init__.py", "manifest.py"}
+    if emit_interfaces:
+        _write_interfaces(provider_dir, provider, tool_entries)
+        keep.add("interfaces.py")
+    _prune_stale_files(provider_dir, keep)
 
     return provider_dir, len(module_names)
 
 
+def _write_files(files: list[tuple[Path, str]]) -> None:
+    """Write rendered modules in one pass once rendering has finished.
+
+    Writes are independent, so larger batches are spread over a small thread pool.
+    """
+
+    if len(files) < 8:
+        for path, content in files:
+            _write_if_changed(path, content)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+        list(pool.map(lambda item: _write_if_changed(*item), files))
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds exactly these bytes.
+
+    Unchanged regenerations then leave mtimes alone and cost one read per file.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _prune_stale_files(provider_dir: Path, keep: set[str]) -> None:
+    """Remove leftovers from an earlier sync, e.g. modules for tools that were dropped."""
+    for entry in provider_dir.iterdir():
+        if entry.name in keep:
+            continue
+        if entry.is_dir():
+            import shutil
+
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+
+
 def maybe_upload_to_modal(base_dir: Path, provider_dir: Path, provider: str) -> None:
     """Copy the generated provider folder into the shared Modal volume."""
 
-    config_path = Path(".modal/functions.py").resolve()
-    if not config_path.exists():
-        raise FileNotFoundError("Modal configuration (.modal/functions.py) not found.")
+    # Reuse the config module across calls (e.g. multi-provider sync loops)
+    module = sys.modules.get("modal_functions")
+    if module is None:
+        import importlib.util
+
+        config_path = Path(".modal/functions.py").resolve()
+        if not config_path.exists():
+            raise FileNotFoundError("Modal configuration (.modal/functions.py) not found.")
 
-    spec = importlib.util.spec_from_file_location("modal_functions", config_path)
-    if spec is None or spec.loader is None:  # pragma: no cover
-        raise RuntimeError("Unable to import Modal configuration module.")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+        spec = importlib.util.spec_from_file_location("modal_functions", config_path)
+        if spec is None or spec.loader is None:  # pragma: no cover
+            raise RuntimeError("Unable to import Modal configuration module.")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["modal_functions"] = module
 
     volume = module.servers_volume()
     remote_root = f"/{provider}"
@@ -230,216 +327,211 @@ def maybe_upload_to_modal(base_dir: Path, provider_dir: Path, provider: str) ->
 
     base_root = base_dir.resolve()
     runtime_path = base_root / RUNTIME_MODULE_NAME
+    schema_path = base_root / SCHEMA_MODULE_NAME
 
+    # One batch for everything; the code_mode helper is uploaded straight from memory
+    code_mode_content = _render_code_mode_helper().encode("utf-8")
     with volume.batch_upload(force=True) as batch:
         batch.put_directory(str(provider_dir), remote_root)
         if runtime_path.exists():
             batch.put_file(str(runtime_path), "/_runtime.py")
+        if schema_path.exists():
+            batch.put_file(str(schema_path), "/_schema.py")
+        batch.put_file(io.BytesIO(code_mode_content), "/_code_mode.py")
 
-    # Also write and upload the code_mode helpers
-    _write_and_upload_code_mode_helpers(volume, base_dir)
+    print("Uploaded code_mode helper to Modal volume.")
 
 
-def _write_and_upload_code_mode_helpers(volume: Any, base_dir: Path) -> None:
-    """Write and upload code_mode helper module to Modal volume.
+_CODE_MODE_HELPER_SOURCE = '''\
+"""MCP Code Mode helpers for progressive tool discovery.
 
-    This creates a standalone _code_mode.py that can be imported in the sandbox
-    for progressive tool discovery and interface generation.
-    """
-    code_mode_content = _render_code_mode_helper()
-    local_path = base_dir / "_code_mode.py"
-    local_path.write_text(code_mode_content, encoding="utf-8")
+This module provides token-efficient tool discovery for sandboxed code execution.
+Import it in the sandbox to search tools and get TypedDict interfaces.
 
-    with volume.batch_upload(force=True) as batch:
-        batch.put_file(str(local_path), "/_code_mode.py")
+Usage in sandbox:
+    import sys
+    sys.path.append('/mnt/servers')
+    from _code_mode import search_tools, get_tool_interface, list_providers
 
-    print("Uploaded code_mode helper to Modal volume.")
+    # Discover tools efficiently
+    tools = search_tools("email", limit=5)
+    interface = get_tool_interface("gmail", "GMAIL_SEND_EMAIL")
+"""
 
+from __future__ import annotations
 
-def _render_code_mode_helper() -> str:
-    """Generate standalone code_mode helper for sandbox use."""
-    return textwrap.dedent('''\
-        """MCP Code Mode helpers for progressive tool discovery.
+import ast
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypedDict
 
-        This module provides token-efficient tool discovery for sandboxed code execution.
-        Import it in the sandbox to search tools and get TypedDict interfaces.
+try:
+    from _schema import typed_dict_source
+except ImportError:  # imported as servers._code_mode
+    from servers._schema import typed_dict_source
 
-        Usage in sandbox:
-            import sys
-            sys.path.append('/mnt/servers')
-            from _code_mode import search_tools, get_tool_interface, list_providers
 
-            # Discover tools efficiently
-            tools = search_tools("email", limit=5)
-            interface = get_tool_interface("gmail", "GMAIL_SEND_EMAIL")
-        """
+class ToolSearchResult(TypedDict):
+    """Result from searching available tools."""
+    provider: str
+    name: str
+    description: str
+    function_name: str
 
-        from __future__ import annotations
 
-        import importlib.util
-        import json
-        import re
-        from pathlib import Path
-        from typing import Any, TypedDict
-
-
-        class ToolSearchResult(TypedDict):
-            """Result from searching available tools."""
-            provider: str
-            name: str
-            description: str
-            function_name: str
-
-
-        class ToolInterface(TypedDict):
-            """Full tool interface with schema."""
-            provider: str
-            name: str
-            description: str
-            function_name: str
-            input_schema: dict[str, Any]
-            python_interface: str
-
-
-        # Default servers path in Modal sandbox
-        DEFAULT_SERVERS_PATH = Path("/mnt/servers")
-
-
-        def _matches_query(query_words: list[str], text: str) -> bool:
-            """Check if ALL query words are found in text (word-based matching).
-
-            This handles queries like 'search web' matching 'search the web'.
-            """
-            text_lower = text.lower()
-            return all(word in text_lower for word in query_words)
-
-
-        def search_tools(
-            query: str,
-            servers_path: str | Path = DEFAULT_SERVERS_PATH,
-            limit: int = 10,
-        ) -> list[ToolSearchResult]:
-            """Search available MCP tools by name or description.
-
-            Uses word-based matching: 'search web' matches 'search the web'.
-            All query words must be present (AND logic).
-
-            Args:
-                query: Search query (space-separated words, case-insensitive).
-                servers_path: Path to servers directory.
-                limit: Maximum results to return.
-
-            Returns:
-                List of matching tools with basic metadata.
-            """
-            servers_path = Path(servers_path)
-            if not servers_path.exists():
-                return []
-
-            # Split query into words for flexible matching
-            query_words = [w.lower() for w in query.strip().split() if w]
-            results: list[ToolSearchResult] = []
-
-            for provider_path in sorted(servers_path.iterdir()):
-                if not provider_path.is_dir() or provider_path.name.startswith("_"):
-                    continue
-
-                manifest_path = provider_path / "manifest.py"
-                if not manifest_path.exists():
-                    continue
-
-                try:
-                    tools = _load_manifest_tools(provider_path.name, servers_path)
-                    for tool in tools:
-                        name = str(tool.get("name", ""))
-                        description = str(tool.get("description", ""))
-                        combined = f"{name} {description}"
-
-                        # Match if no query OR all query words found
-                        if not query_words or _matches_query(query_words, combined):
-                            results.append(
-                                ToolSearchResult(
-                                    provider=provider_path.name,
-                                    name=name,
-                                    description=_truncate(description),
-                                    function_name=_slugify(name),
-                                )
-                            )
-                            if len(results) >= limit:
-                                return results
-                except Exception:
-                    continue
-
-            return results
-
-
-        def list_providers(servers_path: str | Path = DEFAULT_SERVERS_PATH) -> list[str]:
-            """List all available MCP providers."""
-            servers_path = Path(servers_path)
-            if not servers_path.exists():
-                return []
-
-            return [
-                p.name for p in sorted(servers_path.iterdir())
-                if p.is_dir() and not p.name.startswith("_") and (p / "__init__.py").exists()
+class ToolInterface(TypedDict):
+    """Full tool interface with schema."""
+    provider: str
+    name: str
+    description: str
+    function_name: str
+    input_schema: dict[str, Any]
+    python_interface: str
+
+
+# Default servers path in Modal sandbox
+DEFAULT_SERVERS_PATH = Path("/mnt/servers")
+
+
+class _IdentifierTable(dict):
+    """str.translate table: ASCII letters/digits map to themselves, everything else to a space."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return " "
+
+
+_IDENTIFIER_TABLE = _IdentifierTable(
+    (ord(c), c) for c in "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+
+def search_tools(
+    query: str,
+    servers_path: str | Path = DEFAULT_SERVERS_PATH,
+    limit: int = 10,
+) -> list[ToolSearchResult]:
+    """Search available MCP tools by name or description.
+
+    Uses word-based matching: 'search web' matches 'search the web'.
+    All query words must be present (AND logic).
+
+    Args:
+        query: Search query (space-separated words, case-insensitive).
+        servers_path: Path to servers directory.
+        limit: Maximum results to return.
+
+    Returns:
+        List of matching tools with basic metadata.
+    """
+    servers_path = Path(servers_path)
+
+    # Split query into words for flexible matching
+    query_words = [w.lower() for w in query.strip().split() if w]
+    results: list[ToolSearchResult] = []
+
+    for entry in _provider_entries(servers_path):
+        try:
+            tools, blobs = _load_search_index(entry.name, servers_path)
+            for tool, blob in zip(tools, blobs):
+                # Match if no query OR all query words found
+                if not query_words or all(word in blob for word in query_words):
+                    name = str(tool.get("name", ""))
+                    description = str(tool.get("description", ""))
+                    results.append(
+                        ToolSearchResult(
+                            provider=entry.name,
+                            name=name,
+                            description=_truncate(description),
+                            function_name=_slugify(name),
+                        )
+                    )
+                    if len(results) >= limit:
+                        return results
+        except Exception:
+            continue
+
+    return results
+
+
+def list_providers(servers_path: str | Path = DEFAULT_SERVERS_PATH) -> list[str]:
+    """List all available MCP providers."""
+    return [
+        entry.name for entry in _provider_entries(Path(servers_path))
+        if os.path.exists(os.path.join(entry.path, "__init__.py"))
+    ]
+
+
+def _provider_entries(servers_path: Path) -> list[os.DirEntry[str]]:
+    """Provider directories, sorted by name, using scandir's cached d_type."""
+    try:
+        with os.scandir(servers_path) as it:
+            entries = [
+                entry for entry in it
+                if not entry.name.startswith("_") and entry.is_dir(follow_symlinks=False)
             ]
+    except OSError:
+        return []
+    return sorted(entries, key=lambda entry: entry.name)
 
 
-        def get_tool_interface(
-            provider: str,
-            tool_name: str,
-            servers_path: str | Path = DEFAULT_SERVERS_PATH,
-        ) -> dict[str, Any] | None:
-            """Get clean interface for a specific tool - ready to use.
-
-            Returns only what you need:
-            - import_statement: Copy-paste import
-            - function_name: The callable function
-            - parameters: TypedDict showing required params
-            - example: Ready-to-run code
-
-            Args:
-                provider: Provider name (e.g., 'gmail').
-                tool_name: Tool name from search results.
-                servers_path: Path to servers directory.
-
-            Returns:
-                Clean interface dict or None if not found.
-            """
-            servers_path = Path(servers_path)
-            tools = _load_manifest_tools(provider, servers_path)
-
-            for tool in tools:
-                if tool.get("name") == tool_name:
-                    input_schema = tool.get("inputSchema", {})
-                    func_name = _slugify(tool_name)
-                    typed_dict = _generate_typed_dict(provider, tool_name, input_schema)
-                    example = _generate_example(provider, func_name, input_schema)
-
-                    return {
-                        "import": f"from servers.{provider} import {func_name}",
-                        "function": func_name,
-                        "description": _truncate(tool.get("description", ""), 200),
-                        "parameters": typed_dict,
-                        "example": example,
-                    }
-            return None
+def get_tool_interface(
+    provider: str,
+    tool_name: str,
+    servers_path: str | Path = DEFAULT_SERVERS_PATH,
+) -> dict[str, Any] | None:
+    """Get clean interface for a specific tool - ready to use.
+
+    Returns only what you need:
+    - import_statement: Copy-paste import
+    - function_name: The callable function
+    - parameters: TypedDict showing required params
+    - example: Ready-to-run code
+
+    Args:
+        provider: Provider name (e.g., 'gmail').
+        tool_name: Tool name from search results.
+        servers_path: Path to servers directory.
+
+    Returns:
+        Clean interface dict or None if not found.
+    """
+    servers_path = Path(servers_path)
+    tools = _load_manifest_tools(provider, servers_path)
+
+    for tool in tools:
+        if tool.get("name") == tool_name:
+            input_schema = tool.get("inputSchema", {})
+            func_name = _slugify(tool_name)
+            class_name = _to_class_name(f"{provider}_{tool_name}_Input")
+            typed_dict = typed_dict_source(class_name, input_schema).rstrip("\\n")
+            example = _generate_example(provider, func_name, input_schema)
+
+            return {
+                "import": f"from servers.{provider} import {func_name}",
+                "function": func_name,
+                "description": _truncate(tool.get("description", ""), 200),
+                "parameters": typed_dict,
+                "example": example,
+            }
+    return None
 
 
-        def _generate_example(provider: str, func_name: str, schema: dict[str, Any]) -> str:
-            """Generate example code for calling the tool."""
-            properties = schema.get("properties", {})
-            required = set(schema.get("required", []))
+def _generate_example(provider: str, func_name: str, schema: dict[str, Any]) -> str:
+    """Generate example code for calling the tool."""
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", []))
 
-            args = []
-            for prop, prop_schema in properties.items():
-                if prop in required:
-                    example_val = _get_example_value(prop_schema)
-                    args.append(f"    {prop}={example_val},")
+    args = []
+    for prop, prop_schema in properties.items():
+        if prop in required:
+            example_val = _get_example_value(prop_schema)
+            args.append(f"    {prop}={example_val},")
 
-            args_str = "\\n".join(args) if args else "    # No required parameters"
+    args_str = "\\n".join(args) if args else "    # No required parameters"
 
-            return f"""from servers.{provider} import {func_name}
+    return f"""from servers.{provider} import {func_name}
 
 result = await {func_name}(
 {args_str}
@@ -447,162 +539,149 @@ result = await {func_name}(
 print(result)"""
 
 
-        def _get_example_value(schema: dict[str, Any]) -> str:
-            """Get example value for a schema type."""
-            if "enum" in schema:
-                return f'"{schema["enum"][0]}"'
+def _get_example_value(schema: dict[str, Any]) -> str:
+    """Get example value for a schema type."""
+    if "enum" in schema:
+        return f'"{schema["enum"][0]}"'
+
+    t = schema.get("type", "string")
+    defaults = {
+        "string": '"example"',
+        "integer": "1",
+        "number": "1.0",
+        "boolean": "True",
+        "array": "[]",
+        "object": "{}",
+    }
+    return defaults.get(t, "None")
 
-            t = schema.get("type", "string")
-            defaults = {
-                "string": '"example"',
-                "integer": "1",
-                "number": "1.0",
-                "boolean": "True",
-                "array": "[]",
-                "object": "{}",
-            }
-            return defaults.get(t, "None")
-
-
-        def get_all_interfaces(
-            provider: str,
-            servers_path: str | Path = DEFAULT_SERVERS_PATH,
-        ) -> str:
-            """Get Python TypedDict interfaces for all tools in a provider."""
-            servers_path = Path(servers_path)
-            tools = _load_manifest_tools(provider, servers_path)
-
-            lines = [
-                f'"""TypedDict interfaces for {provider} tools."""',
-                "",
-                "from typing import TypedDict, Any, Optional, List, Literal",
-                "",
-            ]
 
-            for tool in tools:
-                tool_name = tool.get("name", "")
-                input_schema = tool.get("inputSchema", {})
-                interface = _generate_typed_dict(provider, tool_name, input_schema)
-                lines.append(interface)
-                lines.append("")
+def get_all_interfaces(
+    provider: str,
+    servers_path: str | Path = DEFAULT_SERVERS_PATH,
+) -> str:
+    """Get Python TypedDict interfaces for all tools in a provider."""
+    servers_path = Path(servers_path)
+    tools = _load_manifest_tools(provider, servers_path)
 
-            return "\\n".join(lines)
+    parts = [
+        f'"""TypedDict interfaces for {provider} tools."""\\n\\n'
+        "from typing import TypedDict, Any, Optional, List, Literal\\n\\n"
+    ]
+    for tool in tools:
+        class_name = _to_class_name(f"{provider}_{tool.get('name', '')}_Input")
+        parts.append(typed_dict_source(class_name, tool.get("inputSchema", {})))
+        parts.append("\\n")
 
+    return "".join(parts)
 
-        def _generate_typed_dict(provider: str, tool_name: str, input_schema: dict[str, Any]) -> str:
-            """Generate Python TypedDict class from JSON Schema."""
-            class_name = _to_class_name(f"{provider}_{tool_name}_Input")
-            properties = input_schema.get("properties", {})
-            required = set(input_schema.get("required", []))
 
-            if not properties:
-                return f"class {class_name}(TypedDict):\\n    pass"
-
-            lines = [f"class {class_name}(TypedDict):"]
-            for prop_name, prop_schema in properties.items():
-                prop_type = _json_to_python_type(prop_schema)
-                is_required = prop_name in required
-                desc = prop_schema.get("description", "")
-
-                if desc:
-                    lines.append(f"    # {_truncate(desc, 80)}")
-                if is_required:
-                    lines.append(f"    {prop_name}: {prop_type}")
-                else:
-                    lines.append(f"    {prop_name}: Optional[{prop_type}]")
-
-            return "\\n".join(lines)
-
-
-        def _json_to_python_type(schema: dict[str, Any]) -> str:
-            """Convert JSON Schema type to Python type."""
-            if not schema:
-                return "Any"
-
-            if "enum" in schema:
-                literals = ", ".join(f'"{v}"' for v in schema["enum"])
-                return f"Literal[{literals}]"
-
-            type_map = {"string": "str", "number": "float", "integer": "int", "boolean": "bool", "null": "None"}
-            schema_type = schema.get("type")
-
-            if schema_type in type_map:
-                return type_map[schema_type]
-            if schema_type == "array":
-                item_type = _json_to_python_type(schema.get("items", {}))
-                return f"List[{item_type}]"
-            if schema_type == "object":
-                return "dict[str, Any]"
-            if isinstance(schema_type, list):
-                return " | ".join(_json_to_python_type({"type": t}) for t in schema_type)
-
-            return "Any"
-
-
-        def _load_manifest_tools(provider: str, servers_path: Path) -> list[dict[str, Any]]:
-            """Load tools from provider manifest."""
-            manifest_path = servers_path / provider / "manifest.py"
-            if not manifest_path.exists():
-                return []
-
-            try:
-                spec = importlib.util.spec_from_file_location(f"{provider}.manifest", manifest_path)
-                if spec is None or spec.loader is None:
-                    return []
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                return getattr(module, "TOOLS", [])
-            except Exception:
-                return []
-
-
-        def _slugify(value: str) -> str:
-            """Convert to valid Python identifier."""
-            return re.sub(r"[^0-9a-zA-Z]+", "_", value).strip("_").lower() or "tool"
-
-
-        def _to_class_name(value: str) -> str:
-            """Convert to PascalCase."""
-            parts = re.sub(r"[^0-9a-zA-Z]+", " ", value).split()
-            return "".join(p.capitalize() for p in parts)
-
-
-        def _truncate(text: str, max_len: int = 150) -> str:
-            """Truncate text."""
-            text = " ".join(str(text).split())
-            return text if len(text) <= max_len else text[:max_len - 3] + "..."
-
-
-        # Convenience function for sandbox use
-        def discover(query: str = "", limit: int = 20) -> str:
-            """Quick discovery helper - returns formatted JSON for sandbox output.
-
-            Usage:
-                print(discover("email"))  # Search for email tools
-                print(discover())         # List all tools
-            """
-            if not query:
-                providers = list_providers()
-                return json.dumps({"providers": providers, "hint": "Use search_tools('query') to find specific tools"}, indent=2)
-
-            results = search_tools(query, limit=limit)
-            return json.dumps({
-                "tools": results,
-                "count": len(results),
-                "hint": "Use get_tool_interface(provider, tool_name) for full schema"
-            }, indent=2)
-
-
-        __all__ = [
-            "search_tools",
-            "list_providers",
-            "get_tool_interface",
-            "get_all_interfaces",
-            "discover",
-            "ToolSearchResult",
-            "ToolInterface",
-        ]
-        ''')
+def _load_search_index(
+    provider: str, servers_path: Path
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Load tools plus a parallel list of lowercased "name description" blobs."""
+    return _read_manifest(servers_path / provider / "manifest.py")
+
+
+def _load_manifest_tools(provider: str, servers_path: Path) -> list[dict[str, Any]]:
+    """Load tools from provider manifest."""
+    return _read_manifest(servers_path / provider / "manifest.py")[0]
+
+
+def _read_manifest(manifest_path: Path) -> tuple[list[dict[str, Any]], list[str]]:
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except OSError:
+        return [], []
+    return _parse_manifest(str(manifest_path), mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _parse_manifest(manifest_path: str, mtime_ns: int) -> tuple[list[dict[str, Any]], list[str]]:
+    """Read the TOOLS list from a generated manifest without importing it.
+
+    Current manifests carry the tools as a ``_TOOLS_JSON`` string; older ones as a
+    literal ``TOOLS = [...]``. Cached per (path, mtime) so repeated searches skip
+    the file entirely.
+    """
+    try:
+        tree = ast.parse(Path(manifest_path).read_text(encoding="utf-8"))
+        tools: list[dict[str, Any]] = []
+        for node in tree.body:
+            if isinstance(node, ast.AnnAssign):
+                target, value = node.target, node.value
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            else:
+                continue
+            if not isinstance(target, ast.Name) or value is None:
+                continue
+            if target.id == "_TOOLS_JSON":
+                tools = json.loads(ast.literal_eval(value))
+                break
+            if target.id == "TOOLS" and not isinstance(value, ast.Call):
+                tools = ast.literal_eval(value)
+                break
+    except Exception:
+        return [], []
+    blobs = [f"{tool.get('name', '')} {tool.get('description', '')}".lower() for tool in tools]
+    return tools, blobs
+
+
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    """Convert to valid Python identifier."""
+    return "_".join(value.translate(_IDENTIFIER_TABLE).split()).lower() or "tool"
+
+
+@lru_cache(maxsize=4096)
+def _to_class_name(value: str) -> str:
+    """Convert to PascalCase."""
+    parts = value.translate(_IDENTIFIER_TABLE).split()
+    return "".join(p.capitalize() for p in parts)
+
+
+def _truncate(text: str, max_len: int = 150) -> str:
+    """Truncate text."""
+    text = " ".join(str(text).split())
+    return text if len(text) <= max_len else text[:max_len - 3] + "..."
+
+
+# Convenience function for sandbox use
+def discover(query: str = "", limit: int = 20) -> str:
+    """Quick discovery helper - returns formatted JSON for sandbox output.
+
+    Usage:
+        print(discover("email"))  # Search for email tools
+        print(discover())         # List all tools
+    """
+    if not query:
+        providers = list_providers()
+        return json.dumps({"providers": providers, "hint": "Use search_tools('query') to find specific tools"}, indent=2)
+
+    results = search_tools(query, limit=limit)
+    return json.dumps({
+        "tools": results,
+        "count": len(results),
+        "hint": "Use get_tool_interface(provider, tool_name) for full schema"
+    }, indent=2)
+
+
+__all__ = [
+    "search_tools",
+    "list_providers",
+    "get_tool_interface",
+    "get_all_interfaces",
+    "discover",
+    "ToolSearchResult",
+    "ToolInterface",
+]
+'''
+
+
+def _render_code_mode_helper() -> str:
+    """Generate standalone code_mode helper for sandbox use."""
+    return _CODE_MODE_HELPER_SOURCE
 
 
 def _print_next_steps(provider: str, transport_config: dict[str, Any], provider_dir: Path) -> None:
@@ -611,56 +690,72 @@ def _print_next_steps(provider: str, transport_config: dict[str, Any], provider_
     env_path = Path(".env.local")
     transport = transport_config.get("transport", "http")
 
-    print("\nNext steps:")
-    print(
-        f"  • Export MCP_SERVER_{env_prefix}_TRANSPORT (defaults to '{transport}') plus the"
-        " connection-specific variables for secrets."
-    )
     if transport == "http":
-        print(
+        transport_hint = (
             f"    - MCP_SERVER_{env_prefix}_URL (or MCP_SERVER_URL) for the HTTP endpoint;"
             f" use MCP_SERVER_{env_prefix}_HEADERS for API keys."
         )
     else:
-        print(
+        transport_hint = (
             f"    - MCP_SERVER_{env_prefix}_COMMAND along with optional _ARGS/_CWD/_ENV"
             " to launch the stdio server."
         )
-    print(f"  • Non-sensitive defaults already live in {init_path} under SERVER_CONFIG.")
-    print(f"  • Secrets passed via CLI are written to {env_path} (edit as needed).\n")
+    message = (
+        "\nNext steps:\n"
+        f"  • Export MCP_SERVER_{env_prefix}_TRANSPORT (defaults to '{transport}') plus the"
+        " connection-specific variables for secrets.\n"
+        f"{transport_hint}\n"
+        f"  • Non-sensitive defaults already live in {init_path} under SERVER_CONFIG.\n"
+        f"  • Secrets passed via CLI are written to {env_path} (edit as needed).\n\n"
+    )
+    # One write instead of a print per line
+    sys.stdout.write(message)
+    sys.stdout.flush()
 
 
 def _write_env_local(provider: str, secret_env: dict[str, str]) -> None:
     if not secret_env:
         return
+    import contextlib
+    import os
+    import tempfile
+
     env_path = Path(".env.local")
-    lines: list[str]
+    buffer = io.StringIO()
+    seen: set[str] = set()
     if env_path.exists():
-        lines = env_path.read_text(encoding="utf-8").splitlines()
-        new_lines: list[str] = []
+        with env_path.open(encoding="utf-8") as handle:
+            for raw_line in handle:
+                line = raw_line.rstrip("\r\n")
+                stripped = line.strip()
+                if stripped and not stripped.startswith("#") and "=" in line:
+                    key = line.partition("=")[0].strip()
+                    if key in secret_env:
+                        line = f"{key}={_quote_env_value(secret_env[key])}"
+                        seen.add(key)
+                buffer.write(line)
+                buffer.write("\n")
     else:
-        lines = []
-        new_lines = ["# Local MCP secrets managed by mcp_tools CLI", ""]
-    seen: set[str] = set()
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            new_lines.append(line)
-            continue
-        if "=" not in line:
-            new_lines.append(line)
-            continue
-        key, _, _ = line.partition("=")
-        key = key.strip()
-        if key in secret_env:
-            new_lines.append(f"{key}={_quote_env_value(secret_env[key])}")
-            seen.add(key)
-        else:
-            new_lines.append(line)
+        buffer.write("# Local MCP secrets managed by mcp_tools CLI\n\n")
     for key, value in secret_env.items():
         if key not in seen:
-            new_lines.append(f"{key}={_quote_env_value(value)}")
-    env_path.write_text("\n".join(new_lines).rstrip() + "\n", encoding="utf-8")
+            buffer.write(f"{key}={_quote_env_value(value)}\n")
+
+    content = buffer.getvalue().rstrip() + "\n"
+    # Write next to the target and swap it in so a crash never leaves a truncated file.
+    # Replace the resolved path so a symlinked .env.local keeps pointing at its target.
+    target = env_path.resolve()
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=target.parent, prefix=".env.local.", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(content)
+        os.replace(tmp.name, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
     print(f"Stored secrets for {provider} in {env_path}")
 
 
@@ -681,44 +776,166 @@ def _sync_modal_secret(provider: str, secret_env: dict[str, str]) -> None:
         print(f"Warning: failed to sync Modal secret '{secret_name}': {exc}")
 
 
-def _render_tool_module(provider: str, provider_title: str, tool_data: dict[str, Any]) -> str:
+_TOOL_MODULE_IMPORTS = """\
+from __future__ import annotations
+
+from pathlib import Path
+from typing import {typing_names}
+
+try:
+    from servers._runtime import {entry}
+except ImportError:  # Modal uploads omit the 'servers' package
+    import sys
+    root = Path(__file__).resolve().parent.parent
+    root_str = str(root)
+    if root_str not in sys.path:
+        sys.path.append(root_str)
+    from _runtime import {entry}
+
+"""
+
+# Parameter names that would shadow what the generated wrapper body relies on.
+_RESERVED_PARAMETERS = frozenset({"TOOL", "UNSET", "arguments", "call_tool", "invoke_tool", "Any"})
+
+# Manifests with at least this many tools get a trigram prefilter in ``search_tools``.
+_TRIGRAM_INDEX_MIN_TOOLS = 64
+
+_LINEAR_SEARCH = """\
+def search_tools(query: str) -> List[dict[str, Any]]:
+    \"\"\"Return tools whose name or description contains the query (case-insensitive).\"\"\"
+
+    normalized = (query or "").strip().lower()
+    if not normalized:
+        return list(TOOLS)
+    return [tool for tool, blob in _SEARCH_INDEX if normalized in blob]
+"""
+
+_TRIGRAM_SEARCH = """\
+def _build_trigrams() -> dict[str, frozenset[int]]:
+    postings: dict[str, set[int]] = {}
+    for index, (_, blob) in enumerate(_SEARCH_INDEX):
+        for start in range(len(blob) - 2):
+            postings.setdefault(blob[start : start + 3], set()).add(index)
+    return {gram: frozenset(ids) for gram, ids in postings.items()}
+
+
+# 3-gram -> indices of the tools whose search blob contains it; built on first search so
+# importing a tool wrapper (which imports this manifest) doesn't pay for it
+_TRIGRAMS: dict[str, frozenset[int]] | None = None
+
+
+def search_tools(query: str) -> List[dict[str, Any]]:
+    \"\"\"Return tools whose name or description contains the query (case-insensitive).\"\"\"
+
+    normalized = (query or "").strip().lower()
+    if not normalized:
+        return list(TOOLS)
+    if len(normalized) < 3:
+        return [tool for tool, blob in _SEARCH_INDEX if normalized in blob]
+    global _TRIGRAMS
+    if _TRIGRAMS is None:
+        _TRIGRAMS = _build_trigrams()
+    candidates: frozenset[int] | None = None
+    for start in range(len(normalized) - 2):
+        postings = _TRIGRAMS.get(normalized[start : start + 3])
+        if not postings:
+            return []
+        candidates = postings if candidates is None else candidates & postings
+        if not candidates:
+            return []
+    return [
+        _SEARCH_INDEX[index][0]
+        for index in sorted(candidates or ())
+        if normalized in _SEARCH_INDEX[index][1]
+    ]
+"""
+
+
+def _render_tool_module(
+    provider: str, provider_title: str, tool_data: dict[str, Any], tool_literal: str
+) -> str:
     tool_name = tool_data.get("name", "tool")
     module_title = provider_title or provider
     function_name = _slugify(tool_name)
-    body = _format_tool_definition(tool_data)
     docstring = _collapse_description(tool_data.get("description") or tool_name)
     provider_literal = json.dumps(provider)
-    lines = [
-        f'"""Auto-generated wrapper for {module_title} → {tool_name}."""',
-        "",
-        "from __future__ import annotations",
-        "",
-        "from pathlib import Path",
-        "from typing import Any",
-        "",
-        "try:",
-        "    from servers._runtime import call_tool",
-        "except ImportError:  # Modal uploads omit the 'servers' package",
-        "    import sys",
-        "    root = Path(__file__).resolve().parent.parent",
-        "    root_str = str(root)",
-        "    if root_str not in sys.path:",
-        "        sys.path.append(root_str)",
-        "    from _runtime import call_tool",
-        "",
-        f"TOOL = {body}",
-        "",
-        f"async def {function_name}(*args: Any, **kwargs: Any) -> Any:",
-    ]
+    parameters = _tool_parameters(tool_data.get("inputSchema") or {})
+    buf = io.StringIO()
+    buf.write(f'"""Auto-generated wrapper for {module_title} → {tool_name}."""\n\n')
+    if parameters is None:
+        buf.write(_TOOL_MODULE_IMPORTS.format(typing_names="Any", entry="call_tool"))
+    else:
+        annotations = " ".join(annotation for _, annotation, _ in parameters)
+        typing_names = ["Any"] + [name for name in ("List", "Literal") if f"{name}[" in annotations]
+        # Optional parameters default to the runtime's UNSET so an explicit None is forwarded
+        has_optional = any(not is_required for _, _, is_required in parameters)
+        entry = "UNSET, invoke_tool" if has_optional else "invoke_tool"
+        buf.write(_TOOL_MODULE_IMPORTS.format(typing_names=", ".join(typing_names), entry=entry))
+    buf.write(f"TOOL = {tool_literal}\n\n")
+    if parameters is None:
+        buf.write(f"async def {function_name}(*args: Any, **kwargs: Any) -> Any:\n")
+    else:
+        buf.write(f"async def {function_name}(\n    *,\n")
+        for name, annotation, is_required in parameters:
+            if is_required:
+                buf.write(f"    {name}: {annotation},\n")
+            else:
+                buf.write(f"    {name}: {annotation} | None = UNSET,\n")
+        buf.write(") -> Any:\n")
     if docstring:
-        lines.append(f'    """{docstring}"""')
+        buf.write(f'    """{docstring}"""\n')
     else:
-        lines.append('    """Invoke the tool via call_tool."""')
-    lines.append(f"    return await call_tool({provider_literal}, TOOL, *args, **kwargs)")
-    lines.append("")
-    lines.append(f"__all__ = ('TOOL', '{function_name}')")
-    lines.append("")
-    return "\n".join(lines)
+        buf.write('    """Invoke the tool via call_tool."""\n')
+    if parameters is None:
+        buf.write(f"    return await call_tool({provider_literal}, TOOL, *args, **kwargs)\n\n")
+    else:
+        required = ", ".join(f'"{name}": {name}' for name, _, is_required in parameters if is_required)
+        buf.write(f"    arguments: dict[str, Any] = {{{required}}}\n")
+        for name, _, is_required in parameters:
+            if not is_required:
+                buf.write(f"    if {name} is not UNSET:\n")
+                buf.write(f'        arguments["{name}"] = {name}\n')
+        buf.write(f"    return await invoke_tool({provider_literal}, TOOL, arguments)\n\n")
+    buf.write(f"__all__ = ('TOOL', '{function_name}')\n")
+    return buf.getvalue()
+
+
+def _tool_parameters(input_schema: dict[str, Any]) -> list[tuple[str, str, bool]] | None:
+    """Keyword-only parameters for a specialized wrapper, or None to keep ``**kwargs``.
+
+    Required parameters come first; optional ones default to ``UNSET`` and are left out of the
+    call unless passed (an explicit None is sent as JSON null). Schemas with open-ended or
+    non-identifier properties keep the generic form.
+    """
+    properties = input_schema.get("properties")
+    if not properties or not isinstance(properties, dict) or input_schema.get("additionalProperties"):
+        return None
+    required = set(input_schema.get("required", []))
+    parameters: list[tuple[str, str, bool]] = []
+    for name, prop_schema in properties.items():
+        if (
+            not name.isidentifier()
+            or keyword.iskeyword(name)
+            or name in _RESERVED_PARAMETERS
+            or not isinstance(prop_schema, dict)
+        ):
+            return None
+        annotation = json_type_to_python(prop_schema)
+        # The annotation lands in an importable signature; never emit one that won't parse
+        if not _is_expression(annotation):
+            return None
+        parameters.append((name, annotation, name in required))
+    parameters.sort(key=lambda parameter: not parameter[2])
+    return parameters
+
+
+@lru_cache(maxsize=1024)
+def _is_expression(source: str) -> bool:
+    try:
+        ast.parse(source, mode="eval")
+    except SyntaxError:
+        return False
+    return True
 
 
 def _render_provider_init(
@@ -735,49 +952,47 @@ def _render_provider_init(
         from servers.gmail.gmail_send_email import gmail_send_email
     """
     module_title = provider_title or provider
-    lines = [
-        f'"""Auto-generated tool package for {module_title}.',
-        "",
-        "Usage:",
-        f"    from servers.{provider} import <tool_function>",
-        "",
-        "Example:",
-        f"    from servers.{provider} import {modules[0] if modules else 'tool_name'}",
-        f"    result = await {modules[0] if modules else 'tool_name'}(param=value)",
-        '"""',
-        "",
-        "from __future__ import annotations",
-        "",
-    ]
+    example = modules[0] if modules else "tool_name"
+    buf = io.StringIO()
+    buf.write(
+        f'"""Auto-generated tool package for {module_title}.\n'
+        "\n"
+        "Usage:\n"
+        f"    from servers.{provider} import <tool_function>\n"
+        "\n"
+        "Example:\n"
+        f"    from servers.{provider} import {example}\n"
+        f"    result = await {example}(param=value)\n"
+        '"""\n'
+        "\n"
+        "from __future__ import annotations\n"
+        "\n"
+    )
 
     # Import modules (for backward compatibility)
     for module in modules:
-        lines.append(f"from . import {module} as _{module}_module")
+        buf.write(f"from . import {module} as _{module}_module\n")
 
     # Re-export the actual functions directly
-    lines.append("")
-    lines.append("# Re-export tool functions for convenient imports")
+    buf.write("\n# Re-export tool functions for convenient imports\n")
     for module in modules:
-        lines.append(f"from .{module} import {module}")
+        buf.write(f"from .{module} import {module}\n")
 
-    lines.append("from . import manifest")
-    lines.append("")
-    lines.append("# Non-sensitive defaults for this provider.")
-    lines.append(f"SERVER_CONFIG = {_format_tool_definition(transport_config)}")
-    lines.append("")
+    buf.write("from . import manifest\n\n")
+    buf.write("# Non-sensitive defaults for this provider.\n")
+    buf.write(f"SERVER_CONFIG = {_format_server_config(transport_config)}\n\n")
 
     # __all__ includes functions directly
     all_names = [f'"{name}"' for name in modules]
     all_names.extend(['"manifest"', '"SERVER_CONFIG"'])
     joined = ", ".join(all_names)
-    lines.append(f"__all__ = ({joined},)")
-    lines.append("")
-    return "\n".join(lines)
+    buf.write(f"__all__ = ({joined},)\n")
+    return buf.getvalue()
 
 
-def _write_manifest(provider_dir: Path, provider: str, tool_entries: list[dict[str, Any]]) -> None:
+def _write_manifest(provider_dir: Path, provider: str, tool_jsons: list[str]) -> None:
     manifest_path = provider_dir / "manifest.py"
-    manifest_path.write_text(_render_manifest(provider, tool_entries), encoding="utf-8")
+    _write_if_changed(manifest_path, _render_manifest(provider, tool_jsons))
 
 
 def _write_interfaces(
@@ -789,420 +1004,444 @@ def _write_interfaces(
     IDE-friendly type hints for tool usage.
     """
     interfaces_path = provider_dir / "interfaces.py"
-    interfaces_path.write_text(_render_interfaces(provider, tool_entries), encoding="utf-8")
+    _write_if_changed(interfaces_path, _render_interfaces(provider, tool_entries))
 
 
 def _render_interfaces(provider: str, tool_entries: list[dict[str, Any]]) -> str:
     """Generate Python TypedDict interfaces for all tools."""
-    lines = [
-        f'"""Auto-generated TypedDict interfaces for {provider} MCP tools.',
-        "",
-        "These interfaces provide type hints for tool parameters.",
-        "Import and use these for IDE autocompletion and type checking.",
-        '"""',
-        "",
-        "from __future__ import annotations",
-        "",
-        "from typing import Any, List, Optional, TypedDict, Literal",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        f'"""Auto-generated TypedDict interfaces for {provider} MCP tools.\n'
+        "\n"
+        "These interfaces provide type hints for tool parameters.\n"
+        "Import and use these for IDE autocompletion and type checking.\n"
+        '"""\n'
+        "\n"
+        "from __future__ import annotations\n"
+        "\n"
+        "from typing import Any, List, Optional, TypedDict, Literal\n"
+        "\n"
+    )
 
+    class_names: list[str] = []
     for tool in tool_entries:
         tool_name = tool.get("name", "unknown")
         description = tool.get("description", "")
         input_schema = tool.get("inputSchema", {})
 
         class_name = _to_class_name(f"{provider}_{tool_name}_Input")
-        interface = _json_schema_to_typed_dict(class_name, input_schema, description)
-        lines.append(interface)
-        lines.append("")
+        class_names.append(f'"{class_name}"')
+        write_typed_dict(buf, class_name, input_schema, description)
+        buf.write("\n")
 
     # Add __all__ export
-    class_names = [
-        f'"{_to_class_name(f"{provider}_{t.get('name', 'unknown')}_Input")}"' for t in tool_entries
-    ]
-    lines.append(f"__all__ = ({', '.join(class_names)},)")
-    lines.append("")
+    buf.write(f"__all__ = ({', '.join(class_names)},)\n")
+    return buf.getvalue()
 
-    return "\n".join(lines)
 
+@lru_cache(maxsize=4096)
+def _to_class_name(value: str) -> str:
+    """Convert string to PascalCase class name."""
+    parts = value.translate(_IDENTIFIER_TABLE).split()
+    return "".join(part.capitalize() for part in parts)
 
-def _json_schema_to_typed_dict(
-    class_name: str, schema: dict[str, Any], description: str = ""
-) -> str:
-    """Convert JSON Schema to Python TypedDict class definition."""
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
 
-    lines = []
-    if description:
-        collapsed = _collapse_description(description)
-        lines.append(f"# {collapsed}")
+_MANIFEST_TEMPLATE = '''\
+"""Tool manifest for {provider}.
 
-    lines.append(f"class {class_name}(TypedDict):")
+Provides lightweight search + schema lookup so sandboxes can discover tools without
+loading every wrapper module.
+"""
 
-    if not properties:
-        lines.append("    pass  # No parameters required")
-        return "\n".join(lines)
+from __future__ import annotations
 
-    for prop_name, prop_schema in properties.items():
-        prop_type = _json_type_to_python(prop_schema)
-        prop_desc = prop_schema.get("description", "")
-        is_required = prop_name in required
+import json
+from typing import Any, List
 
-        if prop_desc:
-            lines.append(f"    # {_collapse_description(prop_desc)[:80]}")
+_TOOLS_JSON = {manifest_literal}
 
-        if is_required:
-            lines.append(f"    {prop_name}: {prop_type}")
-        else:
-            lines.append(f"    {prop_name}: Optional[{prop_type}]")
+TOOLS: List[dict[str, Any]] = json.loads(_TOOLS_JSON)
 
-    return "\n".join(lines)
+# Lowercased "name\\0description" per tool, built once so queries only lowercase themselves
+_SEARCH_INDEX: list[tuple[dict[str, Any], str]] = [
+    (tool, f"{{tool.get('name', '')}}\\0{{tool.get('description', '')}}".lower()) for tool in TOOLS
+]
 
 
-def _json_type_to_python(schema: dict[str, Any]) -> str:
-    """Convert JSON Schema type to Python type annotation."""
-    if not schema:
-        return "Any"
+{search_source}
 
-    schema_type = schema.get("type")
+__all__ = ("TOOLS", "search_tools")
+'''
 
-    if "enum" in schema:
-        literals = ", ".join(f'"{v}"' for v in schema["enum"])
-        return f"Literal[{literals}]"
-
-    type_mapping = {
-        "string": "str",
-        "number": "float",
-        "integer": "int",
-        "boolean": "bool",
-        "null": "None",
-    }
 
-    if schema_type in type_mapping:
-        return type_mapping[schema_type]
+def _render_manifest(provider: str, tool_jsons: list[str]) -> str:
+    # Ship the tools as JSON text: json.loads at import (and in _code_mode) is far
+    # cheaper than compiling or literal_eval-ing an equivalent Python literal.
+    manifest_literal = repr(f"[{','.join(tool_jsons)}]")
+    search_source = (
+        _TRIGRAM_SEARCH if len(tool_jsons) >= _TRIGRAM_INDEX_MIN_TOOLS else _LINEAR_SEARCH
+    )
+    return _MANIFEST_TEMPLATE.format(
+        provider=provider, manifest_literal=manifest_literal, search_source=search_source
+    )
 
-    if schema_type == "array":
-        items = schema.get("items", {})
-        item_type = _json_type_to_python(items)
-        return f"List[{item_type}]"
 
-    if schema_type == "object":
-        additional = schema.get("additionalProperties")
-        if additional:
-            value_type = _json_type_to_python(additional)
-            return f"dict[str, {value_type}]"
-        return "dict[str, Any]"
+def _format_tool_definition(tool_data: dict[str, Any]) -> str:
+    """Render ``tool_data`` as a Python literal with keys sorted at every level.
 
-    if isinstance(schema_type, list):
-        types = [_json_type_to_python({"type": t}) for t in schema_type]
-        return " | ".join(types)
+    The JSON encoder does the heavy lifting in C; only the bare ``true``/``false``/``null``
+    tokens outside of strings need rewriting to their Python spelling.
+    """
+    return _json_to_literal(_dumps(tool_data, sort_keys=True))
 
-    return "Any"
 
+def _json_to_literal(encoded: str) -> str:
+    return _JSON_CONSTANT.sub(_python_constant, encoded)
 
-def _to_class_name(value: str) -> str:
-    """Convert string to PascalCase class name."""
-    parts = re.sub(r"[^0-9a-zA-Z]+", " ", value).split()
-    return "".join(part.capitalize() for part in parts)
 
+def _dumps(value: Any, *, sort_keys: bool = False) -> str:
+    """Compact JSON text for generated sources.
 
-def _render_manifest(provider: str, tool_entries: list[dict[str, Any]]) -> str:
-    manifest_literal = _format_tool_definition(tool_entries)
-    return textwrap.dedent(
-        f'''"""Tool manifest for {provider}.
+    Always the stdlib encoder: generated files must not depend on what else is installed
+    (other encoders spell floats like ``1e-07`` differently and reject big ints).
+    """
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
 
-Provides lightweight search + schema lookup so sandboxes can discover tools without
-loading every wrapper module.
+
+def _format_server_config(transport_config: dict[str, Any]) -> str:
+    """Format SERVER_CONFIG, memoized for batch runs that reuse one transport."""
+    try:
+        key = tuple(
+            sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in transport_config.items())
+        )
+        return _format_server_config_cached(key)
+    except TypeError:  # unhashable value; format directly
+        return _format_tool_definition(transport_config)
+
+
+@lru_cache(maxsize=128)
+def _format_server_config_cached(items: tuple[tuple[str, Any], ...]) -> str:
+    return _format_tool_definition({k: list(v) if isinstance(v, tuple) else v for k, v in items})
+
+
+def _python_constant(match: re.Match[str]) -> str:
+    constant = match.group(1)
+    return _PYTHON_CONSTANTS[constant] if constant else match.group(0)
+
+
+def _write_runtime_module(base_dir: Path) -> None:
+    _write_if_changed(base_dir / RUNTIME_MODULE_NAME, _render_runtime_module())
+
+
+def _write_schema_module(base_dir: Path) -> None:
+    """Ship the shared schema renderer next to ``_runtime.py`` for ``_code_mode``."""
+    content = Path(__file__).with_name(SCHEMA_MODULE_NAME).read_text(encoding="utf-8")
+    _write_if_changed(base_dir / SCHEMA_MODULE_NAME, content)
+
+
+_RUNTIME_MODULE_BODY = '''\
+"""Runtime helpers for generated MCP tool wrappers.
+
+The helper locates connection details via environment variables.
+
+Variable naming pattern (provider slug uppercased, non-alphanumerics replaced with `_`):
+- MCP_SERVER_<PROVIDER>_TRANSPORT: `http` (default) or `stdio`.
+- MCP_SERVER_<PROVIDER>_URL: HTTP endpoint for Streamable HTTP servers.
+- MCP_SERVER_<PROVIDER>_HEADERS: Optional JSON object or comma-separated KEY=VALUE list.
+- MCP_SERVER_<PROVIDER>_COMMAND: Executable for stdio transports.
+- MCP_SERVER_<PROVIDER>_ARGS: Optional JSON array or comma-separated arg list.
+- MCP_SERVER_<PROVIDER>_ENV: Optional JSON object / KEY=VALUE list for env vars.
+- MCP_SERVER_<PROVIDER>_CWD: Working directory for stdio transports.
+- MCP_SERVER_<PROVIDER>_TIMEOUT: Connection timeout seconds (defaults to 30).
+- MCP_SERVER_<PROVIDER>_READ_TIMEOUT: Read timeout seconds (defaults to 300).
+
+Omit the provider segment to define global defaults (e.g., MCP_SERVER_URL).
+Resolved settings are cached per process; call ``_invalidate_config()`` after changing them.
 """
 
 from __future__ import annotations
 
-from typing import Any, List
+import hashlib
+import importlib
+import json
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
-TOOLS: List[dict[str, Any]] = {manifest_literal}
+from pydantic_ai.mcp import MCPServer, MCPServerStdio, MCPServerStreamableHTTP
 
+_CONFIG_PREFIX = "MCP_SERVER"
+_DEFAULT_TIMEOUT = 30.0
+_DEFAULT_READ_TIMEOUT = 300.0
+_NON_UPPER_ALNUM = re.compile(r"[^0-9A-Z]+")
 
-def search_tools(query: str) -> List[dict[str, Any]]:
-    """Return tools whose name or description contains the query (case-insensitive)."""
+_SERVER_CACHE: dict[str, tuple[bytes, MCPServer]] = {}
+_CONFIG_CACHE: dict[str, tuple[dict[str, Any], bytes]] = {}
+# Read-only views: cache hits hand out the stored mapping instead of a copy
+_STATIC_CONFIG_CACHE: dict[str, Mapping[str, Any]] = {}
 
-    normalized = (query or "").strip().lower()
-    if not normalized:
-        return list(TOOLS)
-    results: list[dict[str, Any]] = []
-    for tool in TOOLS:
-        name = str(tool.get("name", "")).lower()
-        description = str(tool.get("description", "")).lower()
-        if normalized in name or normalized in description:
-            results.append(tool)
-    return results
 
+class _Unset:
+    """Default for optional wrapper parameters; tells "not passed" apart from None."""
 
-__all__ = ("TOOLS", "search_tools")
-'''
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+
+UNSET: Any = _Unset()
+
+
+async def call_tool(provider: str, tool: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+    """Call the MCP tool described by ``tool`` for ``provider``."""
+    return await invoke_tool(provider, tool, _coerce_arguments(args, kwargs))
+
+
+async def invoke_tool(provider: str, tool: dict[str, Any], arguments: dict[str, Any]) -> Any:
+    """Call the tool with an already-built arguments dict (used by specialized wrappers)."""
+    tool_name = tool.get("name")
+    if not tool_name:
+        raise ValueError("tool definition must include a 'name' field")
+    server = _get_server(provider)
+    return await server.direct_call_tool(tool_name, arguments)
+
+
+def _coerce_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Return the arguments dict without copying it.
+
+    ``kwargs`` is already a fresh dict from the call, and a positional payload is handed
+    to the server as-is (it is only serialized); do not mutate it while the call is pending.
+    """
+    if args and kwargs:
+        raise ValueError("Pass arguments either positionally (single dict) or via kwargs, not both.")
+    if not args:
+        return kwargs
+    if len(args) != 1:
+        raise TypeError("Pass a single dictionary positional argument or use keyword arguments.")
+    payload = args[0]
+    if not isinstance(payload, dict):
+        raise TypeError("Positional tool arguments must be provided as a dict")
+    return payload
+
+
+def _get_server(provider: str) -> MCPServer:
+    resolved = _CONFIG_CACHE.get(provider)
+    if resolved is None:
+        resolved = _CONFIG_CACHE[provider] = _load_provider_config(provider)
+    config, fingerprint = resolved
+    cached = _SERVER_CACHE.get(provider)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    server = _build_server(config)
+    _SERVER_CACHE[provider] = (fingerprint, server)
+    return server
+
+
+def _invalidate_config(provider: str | None = None) -> None:
+    """Forget resolved configs so the next call re-reads the environment."""
+    if provider is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(provider, None)
+
+
+def _build_server(config: dict[str, Any]) -> MCPServer:
+    try:
+        builder = _BUILDERS[config["transport"]]
+    except KeyError:
+        raise RuntimeError(f"Unsupported MCP transport: {config.get('transport')}") from None
+    return builder(config)
+
+
+def _build_http(config: dict[str, Any]) -> MCPServer:
+    return MCPServerStreamableHTTP(
+        config["url"],
+        headers=config.get("headers"),
+        timeout=config["timeout"],
+        read_timeout=config["read_timeout"],
     )
 
 
-def _format_tool_definition(tool_data: dict[str, Any]) -> str:
-    ordered = _order_data(tool_data)
-    return repr(ordered)
+def _build_stdio(config: dict[str, Any]) -> MCPServer:
+    return MCPServerStdio(
+        config["command"],
+        args=config.get("args"),
+        env=config.get("env"),
+        cwd=config.get("cwd"),
+        timeout=config["timeout"],
+        read_timeout=config["read_timeout"],
+    )
 
 
-def _write_runtime_module(base_dir: Path) -> None:
-    runtime_path = base_dir / RUNTIME_MODULE_NAME
-    content = _render_runtime_module()
-    if runtime_path.exists():
-        existing = runtime_path.read_text(encoding="utf-8")
-        if existing == content:
-            return
-    runtime_path.write_text(content, encoding="utf-8")
+_BUILDERS: dict[str, Callable[[dict[str, Any]], MCPServer]] = {
+    "http": _build_http,
+    "stdio": _build_stdio,
+}
 
 
-def _render_runtime_module() -> str:
-    return textwrap.dedent(
-        '''\
-        """Runtime helpers for generated MCP tool wrappers.
-
-        The helper locates connection details via environment variables.
-
-        Variable naming pattern (provider slug uppercased, non-alphanumerics replaced with `_`):
-        - MCP_SERVER_<PROVIDER>_TRANSPORT: `http` (default) or `stdio`.
-        - MCP_SERVER_<PROVIDER>_URL: HTTP endpoint for Streamable HTTP servers.
-        - MCP_SERVER_<PROVIDER>_HEADERS: Optional JSON object or comma-separated KEY=VALUE list.
-        - MCP_SERVER_<PROVIDER>_COMMAND: Executable for stdio transports.
-        - MCP_SERVER_<PROVIDER>_ARGS: Optional JSON array or comma-separated arg list.
-        - MCP_SERVER_<PROVIDER>_ENV: Optional JSON object / KEY=VALUE list for env vars.
-        - MCP_SERVER_<PROVIDER>_CWD: Working directory for stdio transports.
-        - MCP_SERVER_<PROVIDER>_TIMEOUT: Connection timeout seconds (defaults to 30).
-        - MCP_SERVER_<PROVIDER>_READ_TIMEOUT: Read timeout seconds (defaults to 300).
-
-        Omit the provider segment to define global defaults (e.g., MCP_SERVER_URL).
-        """
-
-        from __future__ import annotations
-
-        import importlib
-        import json
-        import os
-        import re
-        from typing import Any
-
-        from pydantic_ai.mcp import MCPServer, MCPServerStdio, MCPServerStreamableHTTP
-
-        _CONFIG_PREFIX = "MCP_SERVER"
-        _DEFAULT_TIMEOUT = 30.0
-        _DEFAULT_READ_TIMEOUT = 300.0
-
-        _SERVER_CACHE: dict[str, tuple[str, MCPServer]] = {}
-        _STATIC_CONFIG_CACHE: dict[str, dict[str, Any]] = {}
-
-
-        async def call_tool(provider: str, tool: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
-            """Call the MCP tool described by ``tool`` for ``provider``."""
-            payload = _coerce_arguments(args, kwargs)
-            tool_name = tool.get("name")
-            if not tool_name:
-                raise ValueError("tool definition must include a 'name' field")
-            server = _get_server(provider)
-            return await server.direct_call_tool(tool_name, payload)
-
-
-        def _coerce_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
-            if args and kwargs:
-                raise ValueError("Pass arguments either positionally (single dict) or via kwargs, not both.")
-            if not args:
-                return dict(kwargs)
-            if len(args) != 1:
-                raise TypeError("Pass a single dictionary positional argument or use keyword arguments.")
-            payload = args[0]
-            if not isinstance(payload, dict):
-                raise TypeError("Positional tool arguments must be provided as a dict")
-            return dict(payload)
-
-
-        def _get_server(provider: str) -> MCPServer:
-            config = _load_provider_config(provider)
-            fingerprint = json.dumps(config, sort_keys=True)
-            cached = _SERVER_CACHE.get(provider)
-            if cached and cached[0] == fingerprint:
-                return cached[1]
-            server = _build_server(config)
-            _SERVER_CACHE[provider] = (fingerprint, server)
-            return server
-
-
-        def _build_server(config: dict[str, Any]) -> MCPServer:
-            transport = config["transport"]
-            if transport == "http":
-                return MCPServerStreamableHTTP(
-                    config["url"],
-                    headers=config.get("headers"),
-                    timeout=config["timeout"],
-                    read_timeout=config["read_timeout"],
-                )
-            if transport == "stdio":
-                return MCPServerStdio(
-                    config["command"],
-                    args=config.get("args"),
-                    env=config.get("env"),
-                    cwd=config.get("cwd"),
-                    timeout=config["timeout"],
-                    read_timeout=config["read_timeout"],
-                )
-            raise RuntimeError(f"Unsupported MCP transport: {transport}")
+def _load_provider_config(provider: str) -> tuple[dict[str, Any], bytes]:
+    """Resolve the provider config plus a 16-byte digest used to detect changes."""
+    config = _resolve_provider_config(provider)
+    canonical = repr(sorted(config.items())).encode()
+    return config, hashlib.blake2b(canonical, digest_size=16).digest()
 
 
-        def _load_provider_config(provider: str) -> dict[str, Any]:
-            static_config = _load_static_config(provider)
-            provider_key = _normalize_provider(provider)
-            timeout = _as_float(
-                _get_env(provider_key, "TIMEOUT"),
-                _as_float(_get_env("", "TIMEOUT"), static_config.get("timeout", _DEFAULT_TIMEOUT)),
-            )
-            read_timeout = _as_float(
-                _get_env(provider_key, "READ_TIMEOUT"),
-                _as_float(_get_env("", "READ_TIMEOUT"), static_config.get("read_timeout", _DEFAULT_READ_TIMEOUT)),
-            )
-            transport = (
-                _get_env(provider_key, "TRANSPORT")
-                or _get_env("", "TRANSPORT")
-                or static_config.get("transport")
-                or "http"
-            ).lower()
-
-            if transport == "http":
-                url = _get_env(provider_key, "URL") or _get_env("", "URL") or static_config.get("url")
-                if not url:
-                    raise RuntimeError(
-                        f"Missing MCP server URL for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_URL or MCP_SERVER_URL."
-                    )
-                headers = _parse_mapping(_get_env(provider_key, "HEADERS") or _get_env("", "HEADERS"))
-                if headers is None:
-                    headers = static_config.get("headers")
-                return {
-                    "transport": "http",
-                    "url": url,
-                    "headers": headers,
-                    "timeout": timeout,
-                    "read_timeout": read_timeout,
-                }
-
-            if transport == "stdio":
-                command = _get_env(provider_key, "COMMAND") or _get_env("", "COMMAND") or static_config.get("command")
-                if not command:
-                    raise RuntimeError(
-                        f"Missing MCP server command for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_COMMAND."
-                    )
-                args = _parse_sequence(_get_env(provider_key, "ARGS") or _get_env("", "ARGS"))
-                if not args:
-                    args = list(static_config.get("args") or [])
-                env = _parse_mapping(_get_env(provider_key, "ENV") or _get_env("", "ENV"))
-                if env is None:
-                    env = static_config.get("env")
-                cwd = _get_env(provider_key, "CWD") or _get_env("", "CWD") or static_config.get("cwd")
-                return {
-                    "transport": "stdio",
-                    "command": command,
-                    "args": args,
-                    "env": env,
-                    "cwd": cwd,
-                    "timeout": timeout,
-                    "read_timeout": read_timeout,
-                }
+def _resolve_provider_config(provider: str) -> dict[str, Any]:
+    static_config = _load_static_config(provider)
+    provider_key = _normalize_provider(provider)
+    # One snapshot; plain dict lookups instead of repeated os.environ accesses
+    env_snapshot = os.environ.copy()
 
+    def get_env(suffix: str) -> str | None:
+        scoped = env_snapshot.get(f"{_CONFIG_PREFIX}_{provider_key}_{suffix}")
+        return scoped or env_snapshot.get(f"{_CONFIG_PREFIX}_{suffix}")
+
+    timeout = _as_float(get_env("TIMEOUT"), static_config.get("timeout", _DEFAULT_TIMEOUT))
+    read_timeout = _as_float(
+        get_env("READ_TIMEOUT"), static_config.get("read_timeout", _DEFAULT_READ_TIMEOUT)
+    )
+    transport = (get_env("TRANSPORT") or static_config.get("transport") or "http").lower()
+
+    if transport == "http":
+        url = get_env("URL") or static_config.get("url")
+        if not url:
             raise RuntimeError(
-                f"Unsupported MCP transport '{transport}' for provider '{provider}'. Use 'http' or 'stdio'."
+                f"Missing MCP server URL for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_URL or MCP_SERVER_URL."
             )
+        headers = _parse_mapping(get_env("HEADERS"))
+        if headers is None:
+            headers = static_config.get("headers")
+        return {
+            "transport": "http",
+            "url": url,
+            "headers": headers,
+            "timeout": timeout,
+            "read_timeout": read_timeout,
+        }
 
+    if transport == "stdio":
+        command = get_env("COMMAND") or static_config.get("command")
+        if not command:
+            raise RuntimeError(
+                f"Missing MCP server command for provider '{provider}'. Set MCP_SERVER_<PROVIDER>_COMMAND."
+            )
+        args = _parse_sequence(get_env("ARGS"))
+        if not args:
+            args = list(static_config.get("args") or [])
+        env = _parse_mapping(get_env("ENV"))
+        if env is None:
+            env = static_config.get("env")
+        cwd = get_env("CWD") or static_config.get("cwd")
+        return {
+            "transport": "stdio",
+            "command": command,
+            "args": args,
+            "env": env,
+            "cwd": cwd,
+            "timeout": timeout,
+            "read_timeout": read_timeout,
+        }
 
-        def _load_static_config(provider: str) -> dict[str, Any]:
-            cached = _STATIC_CONFIG_CACHE.get(provider)
-            if cached is not None:
-                return dict(cached)
-            module_name = f"{__package__}.{provider}" if __package__ else provider
-            try:
-                module = importlib.import_module(module_name)
-            except ModuleNotFoundError:
-                config: dict[str, Any] = {}
-            else:
-                config = getattr(module, "SERVER_CONFIG", {}) or {}
-            _STATIC_CONFIG_CACHE[provider] = dict(config)
-            return dict(config)
-
-
-        def _normalize_provider(provider: str) -> str:
-            normalized = re.sub(r"[^0-9A-Z]+", "_", provider.upper()).strip("_")
-            return normalized
-
-
-        def _get_env(provider_key: str, suffix: str) -> str | None:
-            if provider_key:
-                scoped = os.getenv(f"{_CONFIG_PREFIX}_{provider_key}_{suffix}")
-                if scoped:
-                    return scoped
-            return os.getenv(f"{_CONFIG_PREFIX}_{suffix}")
-
-
-        def _as_float(value: str | None, default: float) -> float:
-            if value is None:
-                return default
-            try:
-                return float(value)
-            except ValueError as exc:  # pragma: no cover - defensive
-                raise ValueError(f"Invalid float value '{value}'") from exc
-
-
-        def _parse_mapping(value: str | None) -> dict[str, str] | None:
-            if not value:
-                return None
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
-                parsed = None
-            if parsed is None:
-                items: dict[str, str] = {}
-                for part in value.split(","):
-                    part = part.strip()
-                    if not part:
-                        continue
-                    key, sep, val = part.partition("=")
-                    if not sep:
-                        raise ValueError(
-                            "Mapping values must be JSON objects or comma-separated KEY=VALUE entries"
-                        )
-                    items[key.strip()] = val.strip()
-                return items or None
-            if not isinstance(parsed, dict):
-                raise ValueError("Mapping values must be JSON objects or comma-separated KEY=VALUE entries")
-            return {str(key): str(val) for key, val in parsed.items()}
-
-
-        def _parse_sequence(value: str | None) -> list[str]:
-            if not value:
-                return []
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
-                parsed = None
-            if isinstance(parsed, list):
-                return [str(item) for item in parsed]
-            if isinstance(parsed, str):
-                return [parsed]
-            if parsed is not None:
-                raise ValueError("Sequence values must be JSON arrays, strings, or comma/space separated text")
-            parts = [segment.strip() for segment in value.replace(",", " ").split() if segment.strip()]
-            return parts
-        '''
+    raise RuntimeError(
+        f"Unsupported MCP transport '{transport}' for provider '{provider}'. Use 'http' or 'stdio'."
     )
 
 
+def _load_static_config(provider: str) -> Mapping[str, Any]:
+    cached = _STATIC_CONFIG_CACHE.get(provider)
+    if cached is not None:
+        return cached
+    module_name = f"{__package__}.{provider}" if __package__ else provider
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError:
+        config: dict[str, Any] = {}
+    else:
+        config = getattr(module, "SERVER_CONFIG", {}) or {}
+    frozen = _STATIC_CONFIG_CACHE[provider] = MappingProxyType(dict(config))
+    return frozen
+
+
+@lru_cache(maxsize=64)
+def _normalize_provider(provider: str) -> str:
+    upper = provider.upper()
+    if upper.isascii() and upper.isalnum():  # common case: nothing to replace
+        return upper
+    return _NON_UPPER_ALNUM.sub("_", upper).strip("_")
+
+
+def _as_float(value: str | None, default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError as exc:  # pragma: no cover - defensive
+        raise ValueError(f"Invalid float value '{value}'") from exc
+
+
+def _parse_mapping(value: str | None) -> dict[str, str] | None:
+    if not value:
+        return None
+    parsed = None
+    # Only a JSON object can yield a mapping; skip the decoder for KEY=VALUE text
+    if value.lstrip()[:1] in ("{", "[", '"'):
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    if parsed is None:
+        items: dict[str, str] = {}
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            key, sep, val = part.partition("=")
+            if not sep:
+                raise ValueError(
+                    "Mapping values must be JSON objects or comma-separated KEY=VALUE entries"
+                )
+            items[key.strip()] = val.strip()
+        return items or None
+    if not isinstance(parsed, dict):
+        raise ValueError("Mapping values must be JSON objects or comma-separated KEY=VALUE entries")
+    return {str(key): str(val) for key, val in parsed.items()}
+
+
+def _parse_sequence(value: str | None) -> list[str]:
+    if not value:
+        return []
+    parsed = None
+    if value.lstrip()[:1] in ("[", '"'):
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    if isinstance(parsed, list):
+        return [str(item) for item in parsed]
+    if isinstance(parsed, str):
+        return [parsed]
+    if parsed is not None:
+        raise ValueError("Sequence values must be JSON arrays, strings, or comma/space separated text")
+    parts = [segment.strip() for segment in value.replace(",", " ").split() if segment.strip()]
+    return parts
+'''
+
+
+def _render_runtime_module() -> str:
+    return _RUNTIME_MODULE_BODY
+
+
+@lru_cache(maxsize=4096)
 def _slugify(value: str) -> str:
-    value = re.sub(r"[^0-9a-zA-Z]+", "_", value).strip("_").lower()
+    value = "_".join(value.translate(_IDENTIFIER_TABLE).split()).lower()
     return value or "tool"
 
 
-def _collapse_description(value: str | None) -> str:
+@lru_cache(maxsize=4096)
+def _collapse_description(value: str) -> str:
     if not value:
         return ""
     collapsed = " ".join(value.split())
@@ -1210,21 +1449,12 @@ def _collapse_description(value: str | None) -> str:
 
 
 def _provider_env_prefix(provider: str) -> str:
-    normalized = re.sub(r"[^0-9A-Z]+", "_", provider.upper()).strip("_")
+    normalized = _NON_UPPER_ALNUM.sub("_", provider.upper()).strip("_")
     return normalized or "DEFAULT"
 
 
 def _quote_env_value(value: str) -> str:
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-    return f'"{escaped}"'
-
-
-def _order_data(value: Any) -> Any:
-    if isinstance(value, dict):
-        return {key: _order_data(value[key]) for key in sorted(value)}
-    if isinstance(value, list):
-        return [_order_data(item) for item in value]
-    return value
+    return f'"{value.translate(_ENV_ESCAPE)}"'
 
 
 def _parse_key_values(entries: list[str], flag_name: str) -> dict[str, str]:
@@ -1238,7 +1468,13 @@ def _parse_key_values(entries: list[str], flag_name: str) -> dict[str, str]:
 
 
 def main() -> None:
+    import asyncio
+
     args = parse_args()
+    _collapse_description.cache_clear()
+    emit_interfaces = (
+        not args.modal_upload if args.emit_interfaces is None else args.emit_interfaces
+    )
     tools, server_name, transport_config, secret_env = asyncio.run(fetch_tools(args))
     provider_dir, tool_count = sync_to_disk(
         args.provider,
@@ -1246,10 +1482,12 @@ def main() -> None:
         tools,
         args.output_dir,
         transport_config,
+        emit_interfaces=emit_interfaces,
     )
     print(f"Wrote {tool_count} tools to {provider_dir}")
     print("  - manifest.py: Tool search index")
-    print("  - interfaces.py: TypedDict definitions for LLM context")
+    if emit_interfaces:
+        print("  - interfaces.py: TypedDict definitions for LLM context")
     _write_env_local(args.provider, secret_env)
     _sync_modal_secret(args.provider, secret_env)
     _print_next_steps(args.provider, transport_config, provider_dir)
@@ -1258,6 +1496,7 @@ def main() -> None:
         print("Uploaded to Modal volume:")
         print(f"  - /{args.provider}/ (provider tools)")
         print("  - /_runtime.py (MCP call runtime)")
+        print("  - /_schema.py (TypedDict rendering shared with _code_mode)")
         print("  - /_code_mode.py (progressive discovery helpers)")
 
 